@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Compare the in-process DNF backend against the subprocess backend.
+
+Usage: python3 benchmarks/bench_backends.py [--runs N] [--query QUERY] [--package NAME]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.handlers.backends import BACKENDS
+
+
+def time_call(func, runs):
+    samples = []
+    for _ in range(runs):
+        start = perf_counter()
+        func()
+        samples.append((perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--query', default='python3')
+    parser.add_argument('--package', default='bash')
+    args = parser.parse_args()
+    
+    operations = [
+        ('search', lambda backend: backend.search(args.query)),
+        ('get_info', lambda backend: backend.get_info(args.package)),
+        ('get_installed', lambda backend: backend.get_installed()),
+        ('check_updates', lambda backend: backend.check_updates()),
+    ]
+    
+    print(f"{'backend':<12} {'operation':<15} {'first ms':>10} {'median ms':>10} {'max ms':>10}")
+    for name, backend_cls in BACKENDS.items():
+        if not backend_cls.is_available():
+            print(f"{name:<12} unavailable")
+            continue
+        backend = backend_cls()
+        for op_name, op in operations:
+            samples = time_call(lambda: op(backend), args.runs)
+            print(f"{name:<12} {op_name:<15} {samples[0]:>10.1f} "
+                  f"{statistics.median(samples):>10.1f} {max(samples):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
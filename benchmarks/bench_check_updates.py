@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Measure how resolving installed details for pending updates scales.
+
+Compares the old per-package `rpm -q` loop with the bulk query used by
+check_updates, for a range of update counts sampled from the rpmdb.
+
+Usage: python3 benchmarks/bench_check_updates.py [--counts 10,100,400,900]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.handlers.updates.updates import _get_packages_details
+
+
+def per_package(names):
+    details = {}
+    for name in names:
+        result = subprocess.run(
+            ['rpm', '-q', '--queryformat', '%{VERSION}-%{RELEASE}\t%{SUMMARY}', name],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            details[name] = tuple(result.stdout.split('\t', 1))
+    return details
+
+
+def installed_names():
+    result = subprocess.run(
+        ['rpm', '-qa', '--queryformat', '%{NAME}\n'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return sorted(set(result.stdout.split()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--counts', default='10,50,100,400,900')
+    parser.add_argument('--skip-per-package', action='store_true',
+                        help='only time the bulk query')
+    args = parser.parse_args()
+    
+    names = installed_names()
+    counts = [int(count) for count in args.counts.split(',')]
+    
+    print(f"{'updates':>8} {'per-package ms':>15} {'bulk ms':>10} {'speedup':>8}")
+    for count in counts:
+        sample = (names * (count // len(names) + 1))[:count]
+        
+        start = perf_counter()
+        _get_packages_details(sample)
+        bulk_ms = (perf_counter() - start) * 1000
+        
+        if args.skip_per_package:
+            print(f"{count:>8} {'-':>15} {bulk_ms:>10.1f} {'-':>8}")
+            continue
+        
+        start = perf_counter()
+        per_package(sample)
+        per_package_ms = (perf_counter() - start) * 1000
+        print(f"{count:>8} {per_package_ms:>15.1f} {bulk_ms:>10.1f} {per_package_ms / bulk_ms:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
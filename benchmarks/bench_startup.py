@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Measure Fedar cold start and fail when it exceeds the startup budget.
+
+Two numbers are reported as medians over several fresh interpreters:
+import time of everything the main window needs (from `python -X importtime`)
+and wall time from spawning main.py until the first frame is painted.
+Budgets live in benchmarks/startup_budget.json. The checked-in values are
+targets rather than a measured baseline; --update-budget replaces them with
+this machine's medians plus headroom. The first frame run needs a display and
+is skipped without one.
+
+Usage: python3 benchmarks/bench_startup.py [--runs 5] [--top 15] [--update-budget]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(ROOT, 'benchmarks', 'startup_budget.json')
+BUDGET_HEADROOM = 1.25
+
+STARTUP_MODULES = ['src.core.app', 'src.core.window', 'src.pages.search_page']
+
+
+def measure_imports():
+    code = '; '.join(f'import {module}' for module in STARTUP_MODULES)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True
+    )
+    
+    modules = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        total_us += int(self_us)
+        modules.append((int(cumulative_us), name.rstrip()))
+    return total_us / 1000, modules
+
+
+def measure_first_frame(timeout):
+    env = dict(os.environ, FEDAR_BENCHMARK_FIRST_FRAME='1')
+    start = perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'main.py')],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=ROOT,
+        env=env
+    )
+    try:
+        for line in process.stdout:
+            if line.startswith('FEDAR_FIRST_FRAME'):
+                return (perf_counter() - start) * 1000
+            if perf_counter() - start > timeout:
+                break
+        return None
+    finally:
+        process.kill()
+        process.wait()
+
+
+def check(name, value, budget):
+    if value is None or budget is None:
+        return True
+    status = 'ok' if value <= budget else 'OVER BUDGET'
+    print(f"{name:<16} {value:>9.1f} ms  budget {budget:>7.1f} ms  {status}")
+    return value <= budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='slowest modules to list')
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--update-budget', action='store_true',
+                        help='write current medians plus headroom to the budget file')
+    args = parser.parse_args()
+    
+    import_runs = []
+    modules = []
+    for _ in range(args.runs):
+        total_ms, modules = measure_imports()
+        import_runs.append(total_ms)
+    import_ms = statistics.median(import_runs)
+    
+    print("Slowest imports (cumulative, last run):")
+    for cumulative_us, name in sorted(modules, reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+    print()
+    
+    first_frame_ms = None
+    if os.environ.get('WAYLAND_DISPLAY') or os.environ.get('DISPLAY'):
+        frames = [measure_first_frame(args.timeout) for _ in range(args.runs)]
+        frames = [frame for frame in frames if frame is not None]
+        if frames:
+            first_frame_ms = statistics.median(frames)
+        else:
+            print("First frame was never reported")
+    else:
+        print("No display available, skipping first frame measurement")
+    
+    if args.update_budget:
+        budget = {'import_ms': round(import_ms * BUDGET_HEADROOM)}
+        if first_frame_ms is not None:
+            budget['first_frame_ms'] = round(first_frame_ms * BUDGET_HEADROOM)
+        with open(BUDGET_FILE, 'w') as f:
+            json.dump(budget, f, indent=2)
+            f.write('\n')
+        print(f"Wrote {BUDGET_FILE}")
+        return
+    
+    with open(BUDGET_FILE) as f:
+        budget = json.load(f)
+    
+    within = check('imports', import_ms, budget.get('import_ms'))
+    within = check('first frame', first_frame_ms, budget.get('first_frame_ms')) and within
+    sys.exit(0 if within else 1)
+
+
+if __name__ == '__main__':
+    main()
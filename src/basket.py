@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+from src.utils import clean_package_name
+from src.core.logger import logger
+
+
+ACTION_INSTALL = 'install'
+ACTION_REMOVE = 'remove'
+
+
+class TransactionBasket:
+    def __init__(self):
+        self.items = OrderedDict()
+        self.listeners = []
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __contains__(self, name):
+        return clean_package_name(name) in self.items
+    
+    def connect(self, callback):
+        self.listeners.append(callback)
+    
+    def disconnect(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+    
+    def action_for(self, name):
+        return self.items.get(clean_package_name(name))
+    
+    def add(self, name, action):
+        if action not in (ACTION_INSTALL, ACTION_REMOVE):
+            raise ValueError(f'Unknown basket action: {action}')
+        name = clean_package_name(name)
+        if self.items.get(name) == action:
+            return
+        self.items[name] = action
+        logger.debug(f"Basket: {action} {name}")
+        self._notify()
+    
+    def discard(self, name):
+        if self.items.pop(clean_package_name(name), None) is not None:
+            self._notify()
+    
+    def toggle(self, name, action):
+        if self.action_for(name) == action:
+            self.discard(name)
+        else:
+            self.add(name, action)
+    
+    def clear(self):
+        if self.items:
+            self.items.clear()
+            self._notify()
+    
+    @property
+    def installs(self):
+        return [name for name, action in self.items.items() if action == ACTION_INSTALL]
+    
+    @property
+    def removals(self):
+        return [name for name, action in self.items.items() if action == ACTION_REMOVE]
+    
+    def _notify(self):
+        for callback in list(self.listeners):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Basket listener failed: {e}")
+
+
+basket = TransactionBasket()
@@ -1,6 +1,123 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
 from collections import OrderedDict
 from time import time
-from src.preferences import get_pref
+
+from gi.repository import GLib
+
+from src.preferences import get_pref, preferences
+from src.handlers.metadata import get_metadata_stamp, get_rpmdb_stamp
+from src.core.config import SEARCH_CACHE_DISK_TTL, SEARCH_CACHE_DISK_MAX_BYTES
+from src.core.logger import logger
+
+
+CACHE_DIR = os.path.join(GLib.get_user_cache_dir(), 'fedar', 'search')
+ENTRY_SUFFIX = '.json.z'
+
+
+def get_validity_token():
+    return hashlib.sha1(f'{get_metadata_stamp()}:{get_rpmdb_stamp()}'.encode()).hexdigest()
+
+
+class DiskCache:
+    def __init__(self, path=CACHE_DIR, max_bytes=SEARCH_CACHE_DISK_MAX_BYTES, ttl=SEARCH_CACHE_DISK_TTL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+    
+    def _entry_path(self, key):
+        return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest() + ENTRY_SUFFIX)
+    
+    def get(self, key, token):
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = json.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            logger.debug(f"Dropping unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+        
+        expired = time() - entry.get('timestamp', 0) > self.ttl
+        if expired or entry.get('key') != key or entry.get('token') != token:
+            self._remove(path)
+            return None
+        
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry['data']
+    
+    def set(self, key, value, token):
+        path = self._entry_path(key)
+        payload = json.dumps(
+            {'key': key, 'token': token, 'timestamp': time(), 'data': value},
+            separators=(',', ':')
+        ).encode()
+        
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(zlib.compress(payload, 6))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write search cache entry: {e}")
+            return
+        
+        self._evict()
+    
+    def _evict(self):
+        entries = []
+        total = 0
+        now = time()
+        
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return
+        
+        for name in names:
+            if not name.endswith(ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if now - st.st_mtime > self.ttl:
+                self._remove(path)
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+    
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def clear(self):
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(ENTRY_SUFFIX):
+                self._remove(os.path.join(self.path, name))
 
 
 class SearchCache:
@@ -9,35 +126,147 @@ class SearchCache:
         self.max_size = max_size
         self.ttl = ttl
         self.enabled = get_pref('enable_cache', 'true') == 'true'
+        self.disk = DiskCache()
+        self.lock = threading.Lock()
+        preferences.connect(self._on_preferences_changed)
     
-    def get(self, key):
+    def _on_preferences_changed(self, changed):
+        if 'enable_cache' in changed:
+            self.enabled = changed['enable_cache'] == 'true'
+    
+    def peek(self, key):
         if not self.enabled:
             return None
         
-        if key not in self.cache:
-            return None
-        
-        entry = self.cache[key]
-        if time() - entry['timestamp'] > self.ttl:
-            del self.cache[key]
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            if time() - entry['timestamp'] > self.ttl:
+                del self.cache[key]
+                return None
+            self.cache.move_to_end(key)
+            return entry['data']
+    
+    def load(self, key):
+        if not self.enabled:
             return None
         
-        self.cache.move_to_end(key)
-        return entry['data']
+        data = self.disk.get(key, get_validity_token())
+        if data is not None:
+            self._remember(key, data)
+        return data
     
     def set(self, key, value):
         if not self.enabled:
             return
         
-        if key in self.cache:
-            self.cache.move_to_end(key)
-        elif len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)
-        
-        self.cache[key] = {'data': value, 'timestamp': time()}
+        self._remember(key, value)
+        self.disk.set(key, value, get_validity_token())
+    
+    def _remember(self, key, value):
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif len(self.cache) >= self.max_size:
+                self.cache.popitem(last=False)
+            
+            self.cache[key] = {'data': value, 'timestamp': time()}
+    
+    def clear_memory(self):
+        with self.lock:
+            self.cache.clear()
     
     def clear(self):
-        self.cache.clear()
+        self.clear_memory()
+        self.disk.clear()
+
+
+class InfoCache:
+    def __init__(self, max_size=100, ttl=600):
+        self.cache = OrderedDict()
+        self.in_flight = {}
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self.lock = threading.Lock()
+    
+    def get_or_fetch(self, key, fetch):
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                if time() - entry['timestamp'] <= self.ttl:
+                    self.cache.move_to_end(key)
+                    return entry['data']
+                del self.cache[key]
+            
+            flight = self.in_flight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._start(key)
+        
+        if not owner:
+            flight['event'].wait()
+            if flight['error'] is not None:
+                raise flight['error']
+            return flight['data']
+        
+        try:
+            data = fetch()
+        except Exception as e:
+            self.finish(key, flight, error=e)
+            raise
+        self.finish(key, flight, data)
+        return data
+    
+    def join_or_start(self, key, callback, error_callback=None):
+        with self.lock:
+            flight = self.in_flight.get(key)
+            if flight is not None:
+                flight['waiters'].append((callback, error_callback))
+                return None
+            flight = self._start(key)
+            flight['waiters'].append((callback, error_callback))
+            return flight
+    
+    def finish(self, key, flight, data=None, error=None):
+        flight['data'] = data
+        flight['error'] = error
+        with self.lock:
+            if self.in_flight.get(key) is flight:
+                del self.in_flight[key]
+            if error is None and flight['generation'] == self.generation:
+                if key not in self.cache and len(self.cache) >= self.max_size:
+                    self.cache.popitem(last=False)
+                self.cache[key] = {'data': data, 'timestamp': time()}
+                self.cache.move_to_end(key)
+            waiters = flight['waiters']
+        flight['event'].set()
+        
+        for callback, error_callback in waiters:
+            if error is None:
+                callback(data)
+            elif error_callback:
+                error_callback(str(error))
+    
+    def _start(self, key):
+        flight = {'event': threading.Event(), 'data': None, 'error': None, 'generation': self.generation, 'waiters': []}
+        self.in_flight[key] = flight
+        return flight
+    
+    def peek(self, key):
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is None or time() - entry['timestamp'] > self.ttl:
+                return None
+            self.cache.move_to_end(key)
+            return entry['data']
+    
+    def invalidate(self):
+        with self.lock:
+            self.generation += 1
+            self.cache.clear()
 
 
 cache = SearchCache()
+info_cache = InfoCache()
@@ -1,11 +1,13 @@
+import os
+
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Gio, Adw
+from gi.repository import Gtk, Gio, GLib, Adw
 from typing import Optional
 
-from src.core.window import FedarWindow
 from src.core.logger import logger
+from src.core.tracer import tracer
 from src.styles import load_styles
 
 
@@ -13,20 +15,29 @@ def create_app() -> Adw.Application:
     logger.debug("Creating Fedar application")
     
     try:
-        app = Adw.Application(
-            application_id='com.fedar.app',
-            flags=Gio.ApplicationFlags.FLAGS_NONE
-        )
+        with tracer.phase('create_app'):
+            app = Adw.Application(
+                application_id='com.fedar.app',
+                flags=Gio.ApplicationFlags.FLAGS_NONE
+            )
         
         logger.debug("Loading application styles")
-        load_styles()
+        with tracer.phase('load_styles'):
+            load_styles()
         
         def on_activate(app: Adw.Application) -> None:
             logger.info("Application activated")
+            tracer.mark('activate')
             try:
-                win = FedarWindow(app)
+                with tracer.phase('import_window'):
+                    from src.core.window import FedarWindow
+                with tracer.phase('FedarWindow.__init__'):
+                    win = FedarWindow(app)
                 win.present()
+                tracer.mark('present')
                 logger.debug("Main window created and presented")
+                if tracer.enabled or os.environ.get('FEDAR_BENCHMARK_FIRST_FRAME'):
+                    _watch_first_frame(app, win)
             except Exception as e:
                 logger.error(f"Failed to create main window: {e}")
                 raise
@@ -39,6 +50,19 @@ def create_app() -> Adw.Application:
         raise
 
 
+def _watch_first_frame(app: Adw.Application, win: Gtk.Window) -> None:
+    clock = win.get_frame_clock()
+    
+    def on_after_paint(clock) -> None:
+        clock.disconnect(handler)
+        tracer.mark('first_frame')
+        if os.environ.get('FEDAR_BENCHMARK_FIRST_FRAME'):
+            print('FEDAR_FIRST_FRAME', flush=True)
+            GLib.idle_add(app.quit)
+    
+    handler = clock.connect('after-paint', on_after_paint)
+
+
 def main() -> None:
     logger.info("Starting Fedar application")
     try:
@@ -8,8 +8,30 @@ CONTENT_SPACING = 24
 CARD_PADDING = 20
 ROW_PADDING = 14
 
+SCHEDULER_WORKERS = 4
+SCHEDULER_IDLE_WORKERS = 2
+
+TAB_WARMUP_DELAY_MS = 1500
+
+PREF_FLUSH_DELAY_MS = 500
+PREF_RELOAD_INTERVAL = 2
+
 SEARCH_DEBOUNCE_MS = 300
 MAX_SEARCH_RESULTS = 200
+STREAM_BATCH_SIZE = 25
+STREAM_BATCH_INTERVAL = 0.1
+PREFETCH_COUNT = 6
+
+PACKAGE_INDEX_MAX_AGE = 24 * 60 * 60
+PACKAGE_INDEX_CHECK_INTERVAL = 30
+
+METADATA_REFRESH_INTERVAL = 6 * 60 * 60
+METADATA_REFRESH_CHECK_INTERVAL = 15 * 60
+METADATA_REFRESH_INITIAL_DELAY = 60
+METADATA_CACHE_ONLY_MAX_AGE = 3 * 24 * 60 * 60
+
+SEARCH_CACHE_DISK_TTL = 7 * 24 * 60 * 60
+SEARCH_CACHE_DISK_MAX_BYTES = 16 * 1024 * 1024
 
 ICON_PACKAGE = 'package-x-generic-symbolic'
 ICON_SEARCH = 'system-search-symbolic'
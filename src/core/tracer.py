@@ -0,0 +1,114 @@
+import atexit
+import json
+import os
+import platform
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from time import monotonic
+from typing import Any, Dict, Iterator, List, Optional
+
+from gi.repository import GLib
+
+from src.core.logger import logger
+
+
+TRACE_ENV = 'FEDAR_TRACE_STARTUP'
+
+
+def _process_age_ms() -> Optional[float]:
+    try:
+        with open('/proc/self/stat') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        start_ticks = int(fields[19])
+        return (uptime - start_ticks / os.sysconf('SC_CLK_TCK')) * 1000
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupTracer:
+    def __init__(self) -> None:
+        self.target = os.environ.get(TRACE_ENV, '')
+        self.enabled = bool(self.target) and self.target != '0'
+        self.origin = monotonic()
+        self.process_age_ms = _process_age_ms() if self.enabled else None
+        self.events: List[Dict[str, Any]] = []
+        self.first_results: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        
+        if self.enabled:
+            atexit.register(self.write_report)
+    
+    def _now_ms(self) -> float:
+        return round((monotonic() - self.origin) * 1000, 3)
+    
+    def _record(self, event: Dict[str, Any]) -> None:
+        event['thread'] = threading.current_thread().name
+        with self.lock:
+            self.events.append(event)
+    
+    def mark(self, name: str, **details: Any) -> None:
+        if self.enabled:
+            self._record({'name': name, 'at_ms': self._now_ms(), **details})
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        
+        start = self._now_ms()
+        try:
+            yield
+        finally:
+            end = self._now_ms()
+            self._record({'name': name, 'at_ms': start, 'duration_ms': round(end - start, 3)})
+    
+    def first_result(self, tab: str, count: Optional[int] = None) -> None:
+        if not self.enabled:
+            return
+        with self.lock:
+            if tab in self.first_results:
+                return
+            self.first_results[tab] = self._now_ms()
+        self.mark(f'first_result:{tab}', count=count)
+    
+    def _report_path(self) -> str:
+        if self.target not in ('1', 'true', 'yes'):
+            return os.path.expanduser(self.target)
+        
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        return os.path.join(GLib.get_user_cache_dir(), 'fedar', f'startup-trace-{stamp}.json')
+    
+    def write_report(self) -> None:
+        with self.lock:
+            events = sorted(self.events, key=lambda event: event['at_ms'])
+            first_results = dict(self.first_results)
+        
+        report = {
+            'version': 1,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'pid': os.getpid(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'process_age_at_origin_ms': self.process_age_ms,
+            'total_ms': self._now_ms(),
+            'first_results_ms': first_results,
+            'events': events
+        }
+        
+        path = self._report_path()
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+            logger.info(f"Startup trace written to {path}")
+        except OSError as e:
+            logger.warning(f"Could not write startup trace: {e}")
+
+
+tracer = StartupTracer()
@@ -1,22 +1,34 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, Gdk
+from gi.repository import Gtk, Adw, Gdk, GLib
+from importlib import import_module
 from typing import Optional
 
 from src.tab_bar import tab_bar
-from src.pages.search_page import SearchPage
-from src.pages.updates_page import UpdatesPage
-from src.pages.installed_page import InstalledPage
-from src.pages.settings_page import SettingsPage
-from src.pages.detail_page import PackageDetailPage
-from src.setup.welcome import WelcomePage
-from src.setup.features import FeaturesPage
-from src.setup.features_details import FeaturesDetailsPage
-from src.setup.finish import FinishPage
-from src.core.config import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT
+from src.core.config import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, TAB_WARMUP_DELAY_MS
 from src.core.logger import logger
-from src.preferences import is_first_run, get_pref
+from src.core.tracer import tracer
+from src.preferences import is_first_run, get_pref, preferences
+from src.utils import run_in_thread
+from src.scheduler import scheduler, default_priority, PRIORITY_BACKGROUND
+from src.package_state import package_state
+from src.metadata_refresher import metadata_refresher
+from src.cache import cache, info_cache
+
+
+TABS = [
+    ('search', 'Search', 'search_page_obj', 'src.pages.search_page.SearchPage'),
+    ('updates', 'System Updates', 'updates_page_obj', 'src.pages.updates_page.UpdatesPage'),
+    ('installed', 'Installed', 'installed_page_obj', 'src.pages.installed_page.InstalledPage'),
+    ('basket', 'Basket', 'basket_page_obj', 'src.pages.basket_page.BasketPage'),
+    ('settings', 'Settings', 'settings_page_obj', 'src.pages.settings_page.SettingsPage'),
+]
+
+
+def _load_class(path: str):
+    module_name, class_name = path.rsplit('.', 1)
+    return getattr(import_module(module_name), class_name)
 
 
 class FedarWindow(Adw.ApplicationWindow):
@@ -30,7 +42,8 @@ class FedarWindow(Adw.ApplicationWindow):
             self.set_decorated(True)
             self.set_resizable(True)
             
-            self._apply_theme()
+            with tracer.phase('_apply_theme'):
+                self._apply_theme()
             
             self.nav_view = Adw.NavigationView()
             self.set_content(self.nav_view)
@@ -38,8 +51,13 @@ class FedarWindow(Adw.ApplicationWindow):
             key_controller = Gtk.EventControllerKey()
             key_controller.connect('key-pressed', self._on_key_press)
             self.add_controller(key_controller)
+            self.connect('close-request', self._on_close_request)
+            preferences.connect(self._on_preferences_changed)
             
-            if is_first_run():
+            with tracer.phase('is_first_run'):
+                first_run = is_first_run()
+            
+            if first_run:
                 logger.info("First run detected, showing welcome page")
                 self._show_welcome()
             else:
@@ -68,6 +86,7 @@ class FedarWindow(Adw.ApplicationWindow):
     def _show_welcome(self) -> None:
         try:
             logger.debug("Creating welcome page")
+            from src.setup.welcome import WelcomePage
             welcome = WelcomePage(self)
             nav_page = Adw.NavigationPage(child=welcome.page, title='Welcome')
             self.nav_view.push(nav_page)
@@ -79,10 +98,17 @@ class FedarWindow(Adw.ApplicationWindow):
     def _show_main_app(self) -> None:
         try:
             logger.debug("Creating main application page")
-            main_page = self._create_main_page()
+            with tracer.phase('_create_main_page'):
+                main_page = self._create_main_page()
             nav_page = Adw.NavigationPage(child=main_page, title='Fedar')
             self.nav_view.push(nav_page)
             logger.debug("Main application displayed")
+            from src.handlers.dnf_handler import refresh_search_index
+            run_in_thread(refresh_search_index, priority=PRIORITY_BACKGROUND)
+            package_state.connect(self._on_package_state_changed)
+            package_state.start_monitoring()
+            metadata_refresher.connect(self._on_metadata_refreshed)
+            metadata_refresher.start()
         except Exception as e:
             logger.error(f"Failed to show main app: {e}")
             raise
@@ -90,6 +116,7 @@ class FedarWindow(Adw.ApplicationWindow):
     def show_features_page(self) -> None:
         try:
             logger.debug("Showing features page")
+            from src.setup.features import FeaturesPage
             features = FeaturesPage(self)
             nav_page = Adw.NavigationPage(child=features.page, title='Getting Started')
             self.nav_view.push(nav_page)
@@ -100,6 +127,7 @@ class FedarWindow(Adw.ApplicationWindow):
     def show_features_details_page(self) -> None:
         try:
             logger.debug("Showing features details page")
+            from src.setup.features_details import FeaturesDetailsPage
             details = FeaturesDetailsPage(self)
             nav_page = Adw.NavigationPage(child=details.page, title='More Information')
             self.nav_view.push(nav_page)
@@ -111,6 +139,7 @@ class FedarWindow(Adw.ApplicationWindow):
         try:
             logger.debug("Showing finish page")
             self.nav_view.pop()
+            from src.setup.finish import FinishPage
             finish = FinishPage(self)
             nav_page = Adw.NavigationPage(child=finish.page, title='Ready')
             self.nav_view.push(nav_page)
@@ -141,22 +170,16 @@ class FedarWindow(Adw.ApplicationWindow):
             container.append(self.tab_bar.container)
             
             self.view_stack = Adw.ViewStack()
+            self.tab_slots = {}
             
-            logger.debug("Initializing search page")
-            self.search_page_obj = SearchPage(self)
-            self.view_stack.add_titled(self.search_page_obj.page, 'search', 'Search')
-            
-            logger.debug("Initializing updates page")
-            self.updates_page_obj = UpdatesPage(self)
-            self.view_stack.add_titled(self.updates_page_obj.page, 'updates', 'System Updates')
-            
-            logger.debug("Initializing installed page")
-            self.installed_page_obj = InstalledPage(self)
-            self.view_stack.add_titled(self.installed_page_obj.page, 'installed', 'Installed')
+            for name, title, _, _ in TABS:
+                slot = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+                slot.set_vexpand(True)
+                self.tab_slots[name] = slot
+                self.view_stack.add_titled(slot, name, title)
             
-            logger.debug("Initializing settings page")
-            self.settings_page_obj = SettingsPage(self)
-            self.view_stack.add_titled(self.settings_page_obj.page, 'settings', 'Settings')
+            self._ensure_tab('search')
+            GLib.timeout_add(TAB_WARMUP_DELAY_MS, self._start_tab_warmup)
             
             container.append(self.view_stack)
             logger.debug("Main page created successfully")
@@ -165,12 +188,41 @@ class FedarWindow(Adw.ApplicationWindow):
             logger.error(f"Failed to create main page: {e}")
             raise
     
+    def _ensure_tab(self, tab_name: str):
+        for name, _, attr, page_path in TABS:
+            if name != tab_name:
+                continue
+            page = getattr(self, attr, None)
+            if page is None:
+                logger.debug(f"Initializing {tab_name} page")
+                with tracer.phase(f'page:{tab_name}'):
+                    page = _load_class(page_path)(self)
+                setattr(self, attr, page)
+                self.tab_slots[name].append(page.page)
+            return page
+        return None
+    
+    def _start_tab_warmup(self) -> bool:
+        pending = [name for name, _, _, _ in TABS]
+        
+        def warm_next() -> bool:
+            if pending:
+                with default_priority(PRIORITY_BACKGROUND):
+                    self._ensure_tab(pending.pop(0))
+            return bool(pending)
+        
+        GLib.idle_add(warm_next, priority=GLib.PRIORITY_LOW)
+        return False
+    
     def switch_to_tab(self, tab_name: str) -> None:
         try:
             logger.debug(f"Switching to tab: {tab_name}")
-            valid_tabs = ['search', 'updates', 'installed', 'settings']
+            valid_tabs = [name for name, _, _, _ in TABS]
             
             if tab_name in valid_tabs:
+                if tab_name != 'search':
+                    self.search_page_obj.cancel_prefetch()
+                self._ensure_tab(tab_name)
                 self.view_stack.set_visible_child_name(tab_name)
                 self.tab_bar.set_active(tab_name)
             else:
@@ -181,6 +233,7 @@ class FedarWindow(Adw.ApplicationWindow):
     def show_package_detail(self, package_name: str) -> None:
         try:
             logger.debug(f"Showing package detail for: {package_name}")
+            from src.pages.detail_page import PackageDetailPage
             detail_page = PackageDetailPage(package_name, self.nav_view, self)
             nav_page = Adw.NavigationPage(child=detail_page, title=package_name)
             self.nav_view.push(nav_page)
@@ -204,6 +257,34 @@ class FedarWindow(Adw.ApplicationWindow):
         except Exception as e:
             logger.error(f"Failed to refresh updates: {e}")
     
+    def _on_close_request(self, window: Adw.ApplicationWindow) -> bool:
+        preferences.flush()
+        for _, _, attr, _ in TABS:
+            page = getattr(self, attr, None)
+            if page is not None:
+                scheduler.cancel_owner(page)
+        return False
+    
+    def _on_preferences_changed(self, changed) -> None:
+        if 'dark_mode' in changed:
+            self._apply_theme()
+    
+    def _on_package_state_changed(self, changes) -> None:
+        cache.clear_memory()
+        info_cache.invalidate()
+        if 'rpmdb' in changes:
+            self.load_installed_packages()
+        self.refresh_updates()
+    
+    def _on_metadata_refreshed(self) -> None:
+        if metadata_refresher.running or metadata_refresher.last_error:
+            return
+        from src.handlers.dnf_handler import refresh_search_index
+        cache.clear_memory()
+        info_cache.invalidate()
+        run_in_thread(refresh_search_index, priority=PRIORITY_BACKGROUND)
+        self.refresh_updates()
+    
     def _on_key_press(self, controller: Gtk.EventControllerKey, keyval: int, keycode: int, state: Gdk.ModifierType) -> bool:
         if keyval == Gdk.KEY_Escape:
             try:
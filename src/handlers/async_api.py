@@ -0,0 +1,371 @@
+import subprocess
+from typing import Callable, List, Dict, Any, Optional
+
+from gi.repository import Gio, GLib
+
+from src.handlers.common import extract_base_name, get_dnf_env
+from src.handlers.metadata import get_rpmdb_stamp, cache_only, needs_metadata
+from src.handlers.search.search import parse_search_line
+from src.handlers.info.info import parse_dnf_info, parse_rpm_info
+from src.handlers.installed.installed import (
+    INSTALLED_QUERY,
+    VERSIONS_QUERY,
+    parse_installed,
+    get_cached_versions,
+    store_installed_versions,
+    load_installed_snapshot,
+    save_installed_snapshot,
+    annotate_installed
+)
+from src.handlers.updates.updates import (
+    CHECK_UPDATE_QUERY,
+    DETAILS_QUERY,
+    RPM_QUERY_CHUNK,
+    parse_check_update,
+    parse_details,
+    build_updates
+)
+from src.core.config import STREAM_BATCH_SIZE
+from src.core.logger import logger
+
+Callback = Callable[[Any], None]
+ErrorCallback = Optional[Callable[[str], None]]
+
+
+def _is_cancelled(error: GLib.Error) -> bool:
+    return error.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED)
+
+
+def _fail(error_callback: ErrorCallback, message: str) -> None:
+    if error_callback:
+        error_callback(message)
+
+
+class AsyncProcess:
+    def __init__(self, args: List[str], flags: Gio.SubprocessFlags, cancellable: Optional[Gio.Cancellable] = None,
+                 timeout: Optional[int] = None, env: Optional[Dict[str, str]] = None):
+        launcher = Gio.SubprocessLauncher.new(flags)
+        if env is not None:
+            launcher.set_environ([f'{key}={value}' for key, value in env.items()])
+        
+        self.args = args
+        self.process = launcher.spawnv(args)
+        self.cancellable = cancellable or Gio.Cancellable()
+        self.timed_out = False
+        self._cancel_handler = self.cancellable.connect('cancelled', self._on_cancelled)
+        self._timeout_id = GLib.timeout_add_seconds(timeout, self._on_timeout) if timeout else None
+        
+        if self.cancellable.is_cancelled():
+            self.process.force_exit()
+    
+    @property
+    def returncode(self) -> int:
+        if self.process.get_if_exited():
+            return self.process.get_exit_status()
+        return -1
+    
+    @property
+    def cancelled(self) -> bool:
+        return self.cancellable.is_cancelled()
+    
+    def _on_cancelled(self, cancellable: Gio.Cancellable) -> None:
+        self.process.force_exit()
+    
+    def _on_timeout(self) -> bool:
+        self._timeout_id = None
+        self.timed_out = True
+        self.process.force_exit()
+        return False
+    
+    def finish(self) -> None:
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = None
+        if self._cancel_handler:
+            self.cancellable.disconnect(self._cancel_handler)
+            self._cancel_handler = None
+
+
+def run_async(args: List[str], callback: Callback, error_callback: ErrorCallback = None,
+              cancellable: Optional[Gio.Cancellable] = None, timeout: Optional[int] = None,
+              env: Optional[Dict[str, str]] = None) -> Optional[AsyncProcess]:
+    flags = Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE
+    try:
+        proc = AsyncProcess(args, flags, cancellable, timeout, env)
+    except GLib.Error as e:
+        _fail(error_callback, e.message)
+        return None
+    
+    def on_done(process: Gio.Subprocess, result: Gio.AsyncResult) -> None:
+        try:
+            _, stdout, stderr = process.communicate_utf8_finish(result)
+        except GLib.Error as e:
+            proc.finish()
+            if not _is_cancelled(e):
+                _fail(error_callback, e.message)
+            return
+        
+        proc.finish()
+        if proc.cancelled:
+            return
+        if proc.timed_out:
+            _fail(error_callback, f'{args[0]} timed out')
+            return
+        callback(subprocess.CompletedProcess(args, proc.returncode, stdout or '', stderr or ''))
+    
+    proc.process.communicate_utf8_async(None, proc.cancellable, on_done)
+    return proc
+
+
+def run_dnf_async(args: List[str], callback: Callback, error_callback: ErrorCallback = None,
+                  cancellable: Optional[Gio.Cancellable] = None, timeout: Optional[int] = None) -> None:
+    cached_args = cache_only(args)
+    env = get_dnf_env()
+    
+    def on_done(result: subprocess.CompletedProcess) -> None:
+        if needs_metadata(result.returncode, result.stdout + result.stderr):
+            logger.debug(f"Cached metadata not usable for {' '.join(args[:2])}, retrying with a refresh")
+            run_async(args, callback, error_callback, cancellable, timeout, env)
+            return
+        callback(result)
+    
+    run_async(cached_args, on_done if cached_args is not args else callback, error_callback, cancellable, timeout, env)
+
+
+def stream_lines_async(args: List[str], on_line: Callable[[str], None], callback: Callable[[int], None],
+                       error_callback: ErrorCallback = None, cancellable: Optional[Gio.Cancellable] = None,
+                       timeout: Optional[int] = None, env: Optional[Dict[str, str]] = None,
+                       on_error_line: Optional[Callable[[str], None]] = None) -> Optional[AsyncProcess]:
+    flags = Gio.SubprocessFlags.STDOUT_PIPE
+    flags |= Gio.SubprocessFlags.STDERR_PIPE if on_error_line else Gio.SubprocessFlags.STDERR_SILENCE
+    try:
+        proc = AsyncProcess(args, flags, cancellable, timeout, env)
+    except GLib.Error as e:
+        _fail(error_callback, e.message)
+        return None
+    
+    readers = [(Gio.DataInputStream.new(proc.process.get_stdout_pipe()), on_line)]
+    if on_error_line:
+        readers.append((Gio.DataInputStream.new(proc.process.get_stderr_pipe()), on_error_line))
+    open_streams = len(readers)
+    failed = False
+    
+    def on_error(error: GLib.Error) -> None:
+        nonlocal failed
+        if failed:
+            return
+        failed = True
+        proc.finish()
+        if not _is_cancelled(error):
+            _fail(error_callback, error.message)
+    
+    def on_exit(process: Gio.Subprocess, result: Gio.AsyncResult) -> None:
+        try:
+            process.wait_finish(result)
+        except GLib.Error as e:
+            on_error(e)
+            return
+        
+        proc.finish()
+        if proc.cancelled:
+            return
+        if proc.timed_out:
+            _fail(error_callback, f'{args[0]} timed out')
+            return
+        callback(proc.returncode)
+    
+    def read(stream: Gio.DataInputStream, handler: Callable[[str], None]) -> None:
+        def on_read(stream: Gio.DataInputStream, result: Gio.AsyncResult) -> None:
+            nonlocal open_streams
+            try:
+                line, _ = stream.read_line_finish_utf8(result)
+            except GLib.Error as e:
+                on_error(e)
+                return
+            
+            if line is None:
+                open_streams -= 1
+                if not open_streams and not failed:
+                    proc.process.wait_async(proc.cancellable, on_exit)
+                return
+            handler(line)
+            stream.read_line_async(GLib.PRIORITY_DEFAULT, proc.cancellable, on_read)
+        
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, proc.cancellable, on_read)
+    
+    for stream, handler in readers:
+        read(stream, handler)
+    return proc
+
+
+def get_installed_versions_async(callback: Callable[[Dict[str, str]], None],
+                                 cancellable: Optional[Gio.Cancellable] = None) -> None:
+    versions = get_cached_versions()
+    if versions is not None:
+        callback(versions)
+        return
+    
+    stamp = get_rpmdb_stamp()
+    
+    def on_done(result: subprocess.CompletedProcess) -> None:
+        if result.returncode != 0:
+            logger.warning(f"Could not read installed package versions: {result.stderr.strip()}")
+            callback({})
+            return
+        callback(store_installed_versions(stamp, result.stdout))
+    
+    def on_error(error_msg: str) -> None:
+        logger.warning(f"Could not read installed package versions: {error_msg}")
+        callback({})
+    
+    run_async(VERSIONS_QUERY, on_done, on_error, cancellable, timeout=30)
+
+
+def search_packages_async(query: str, callback: Callable[[List[Dict[str, Any]]], None],
+                          error_callback: ErrorCallback = None,
+                          on_batch: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                          cancellable: Optional[Gio.Cancellable] = None) -> None:
+    logger.debug(f"Searching packages asynchronously with query: {query}")
+    
+    def on_versions(versions: Dict[str, str]) -> None:
+        packages: List[Dict[str, Any]] = []
+        batch: List[Dict[str, Any]] = []
+        errors: List[str] = []
+        seen = set()
+        env = get_dnf_env()
+        
+        def flush() -> None:
+            if batch and on_batch:
+                on_batch(annotate_installed(list(batch), versions))
+            batch.clear()
+        
+        def on_line(line: str) -> None:
+            pkg = parse_search_line(line, seen)
+            if pkg:
+                packages.append(pkg)
+                batch.append(pkg)
+            if len(batch) >= STREAM_BATCH_SIZE:
+                flush()
+        
+        def on_exit(returncode: int) -> None:
+            if args is not search_args and not packages and needs_metadata(returncode, '\n'.join(errors)):
+                logger.debug("Cached metadata not usable for search, retrying with a metadata refresh")
+                stream_lines_async(search_args, on_line, on_exit_refreshed, on_error, cancellable, 30, env)
+                return
+            on_exit_refreshed(returncode)
+        
+        def on_exit_refreshed(returncode: int) -> None:
+            if returncode != 0:
+                logger.error(f"DNF search failed for query: {query}, exit code: {returncode}")
+                _fail(error_callback, 'DNF search failed')
+                return
+            flush()
+            logger.info(f"Found {len(packages)} packages for query: {query}")
+            callback(annotate_installed(packages, versions))
+        
+        def on_error(error_msg: str) -> None:
+            logger.error(f"DNF search failed for query: {query}, error: {error_msg}")
+            _fail(error_callback, 'DNF search timed out' if 'timed out' in error_msg else 'DNF search failed')
+        
+        search_args = ['dnf', 'search', '--quiet', query]
+        args = cache_only(search_args)
+        stream_lines_async(args, on_line, on_exit, on_error, cancellable, 30, env, errors.append)
+    
+    get_installed_versions_async(on_versions, cancellable)
+
+
+def get_package_info_async(package_name: str, callback: Callable[[Dict[str, Any]], None],
+                           error_callback: ErrorCallback = None,
+                           cancellable: Optional[Gio.Cancellable] = None) -> None:
+    logger.debug(f"Getting package info asynchronously for: {package_name}")
+    base_name = extract_base_name(package_name)
+    
+    def on_error(error_msg: str) -> None:
+        logger.error(f"Failed to get package info for {package_name}: {error_msg}")
+        _fail(error_callback, f'Failed to get package info: {error_msg}')
+    
+    def on_rpm_info(result: subprocess.CompletedProcess) -> None:
+        if result.returncode != 0:
+            logger.warning(f"Package not found via RPM: {base_name}")
+            _fail(error_callback, 'Package not found')
+            return
+        callback(parse_rpm_info(result.stdout, base_name))
+    
+    def on_versions(versions: Dict[str, str]) -> None:
+        def on_dnf_info(result: subprocess.CompletedProcess) -> None:
+            if result.returncode != 0:
+                logger.debug(f"DNF info failed, trying RPM info for: {base_name}")
+                run_async(['rpm', '-qi', base_name], on_rpm_info, on_error, cancellable, timeout=10)
+                return
+            callback(parse_dnf_info(result.stdout, base_name, versions))
+        
+        run_dnf_async(['dnf', 'info', base_name], on_dnf_info, on_error, cancellable, timeout=10)
+    
+    get_installed_versions_async(on_versions, cancellable)
+
+
+def get_installed_packages_async(callback: Callable[[List[Dict[str, Any]]], None],
+                                 error_callback: ErrorCallback = None,
+                                 cancellable: Optional[Gio.Cancellable] = None) -> None:
+    stamp = get_rpmdb_stamp()
+    packages = load_installed_snapshot(stamp)
+    if packages is not None:
+        logger.info(f"Loaded {len(packages)} installed packages from snapshot")
+        callback(packages)
+        return
+    
+    def on_done(result: subprocess.CompletedProcess) -> None:
+        if result.returncode != 0:
+            logger.error(f"Failed to get installed packages: {result.stderr.strip()}")
+            _fail(error_callback, f'Failed to get installed packages: exit code {result.returncode}')
+            return
+        packages = parse_installed(result.stdout)
+        save_installed_snapshot(stamp, packages)
+        logger.info(f"Found {len(packages)} installed packages")
+        callback(packages)
+    
+    def on_error(error_msg: str) -> None:
+        logger.error(f"Failed to get installed packages: {error_msg}")
+        _fail(error_callback, f'Failed to get installed packages: {error_msg}')
+    
+    run_async(INSTALLED_QUERY, on_done, on_error, cancellable, timeout=30)
+
+
+def check_updates_async(callback: Callable[[List[Dict[str, Any]]], None],
+                        error_callback: ErrorCallback = None,
+                        cancellable: Optional[Gio.Cancellable] = None) -> None:
+    def on_check(result: subprocess.CompletedProcess) -> None:
+        if result.returncode == 0 and not result.stdout.strip():
+            logger.info("No updates available")
+            callback([])
+            return
+        
+        available = parse_check_update(result.stdout)
+        names = [name for name, _ in available]
+        details: Dict[str, Any] = {}
+        
+        def fetch_details(start: int) -> None:
+            if start >= len(names):
+                updates = build_updates(available, details)
+                logger.info(f"Found {len(updates)} available updates")
+                callback(updates)
+                return
+            
+            def on_details(rpm_result: subprocess.CompletedProcess) -> None:
+                parse_details(rpm_result.stdout, details)
+                fetch_details(start + RPM_QUERY_CHUNK)
+            
+            def on_details_error(error_msg: str) -> None:
+                logger.debug(f"Could not query installed details: {error_msg}")
+                fetch_details(start + RPM_QUERY_CHUNK)
+            
+            chunk = names[start:start + RPM_QUERY_CHUNK]
+            run_async([*DETAILS_QUERY, *chunk], on_details, on_details_error, cancellable, timeout=30)
+        
+        fetch_details(0)
+    
+    def on_error(error_msg: str) -> None:
+        logger.error(f"Failed to check updates: {error_msg}")
+        _fail(error_callback, 'Update check timed out' if 'timed out' in error_msg else f'Failed to check updates: {error_msg}')
+    
+    run_dnf_async(CHECK_UPDATE_QUERY, on_check, on_error, cancellable, timeout=60)
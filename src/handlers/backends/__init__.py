@@ -0,0 +1,64 @@
+import os
+import threading
+from typing import Optional
+
+from src.handlers.backends.base import PackageBackend, BackendUnavailable
+from src.handlers.backends.subprocess_backend import SubprocessBackend
+from src.handlers.backends.dnf_backend import DnfBackend
+from src.preferences import get_pref
+from src.core.logger import logger
+
+BACKENDS = {
+    DnfBackend.name: DnfBackend,
+    SubprocessBackend.name: SubprocessBackend,
+}
+
+_backend: Optional[PackageBackend] = None
+_backend_lock = threading.Lock()
+
+
+def create_backend(name: str = 'auto') -> PackageBackend:
+    if name in BACKENDS and BACKENDS[name].is_available():
+        return BACKENDS[name]()
+    
+    if name not in ('auto', SubprocessBackend.name):
+        logger.warning(f"Backend '{name}' is not available, using auto selection")
+    
+    if DnfBackend.is_available():
+        return DnfBackend()
+    return SubprocessBackend()
+
+
+def get_backend() -> PackageBackend:
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            name = os.environ.get('FEDAR_BACKEND') or get_pref('backend', 'auto')
+            _backend = create_backend(name)
+            logger.info(f"Using {_backend.name} package backend")
+        return _backend
+
+
+def current_backend() -> Optional[PackageBackend]:
+    return _backend
+
+
+def fall_back_to_subprocess() -> PackageBackend:
+    global _backend
+    with _backend_lock:
+        if not isinstance(_backend, SubprocessBackend):
+            logger.warning("Falling back to subprocess package backend")
+            _backend = SubprocessBackend()
+        return _backend
+
+
+__all__ = [
+    'PackageBackend',
+    'BackendUnavailable',
+    'SubprocessBackend',
+    'DnfBackend',
+    'create_backend',
+    'get_backend',
+    'current_backend',
+    'fall_back_to_subprocess'
+]
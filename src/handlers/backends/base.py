@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List, Dict, Any, Optional
+
+from src.utils import Cancellable
+
+
+class BackendUnavailable(Exception):
+    pass
+
+
+class PackageBackend(ABC):
+    name = 'base'
+    
+    @staticmethod
+    def is_available() -> bool:
+        return True
+    
+    @abstractmethod
+    def search(self, query: str, cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
+        pass
+    
+    def search_stream(self, query: str, on_batch: Callable[[List[Dict[str, Any]]], None],
+                      cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
+        return self.search(query, cancellable)
+    
+    @abstractmethod
+    def get_info(self, package_name: str) -> Dict[str, Any]:
+        pass
+    
+    @abstractmethod
+    def get_installed(self) -> List[Dict[str, Any]]:
+        pass
+    
+    @abstractmethod
+    def get_installed_versions(self) -> Dict[str, str]:
+        pass
+    
+    @abstractmethod
+    def list_package_names(self) -> List[str]:
+        pass
+    
+    @abstractmethod
+    def check_updates(self) -> List[Dict[str, Any]]:
+        pass
+    
+    def reload(self) -> None:
+        pass
@@ -0,0 +1,195 @@
+import os
+import threading
+from typing import List, Dict, Any, Optional
+
+from src.handlers.backends.base import PackageBackend, BackendUnavailable
+from src.handlers.common import extract_base_name, format_size
+from src.handlers.installed import get_installed_packages, get_installed_versions
+from src.handlers.metadata import get_metadata_stamp, get_rpmdb_stamp, metadata_is_fresh, is_dnf5
+from src.utils import Cancellable
+from src.core.logger import logger
+
+dnf = None
+hawkey = None
+
+
+def _load_dnf() -> bool:
+    global dnf, hawkey
+    if dnf is None:
+        try:
+            import dnf
+            import dnf.exceptions
+            import dnf.yum.misc
+            import hawkey
+        except ImportError:
+            dnf = None
+            hawkey = None
+            return False
+    return True
+
+
+class DnfBackend(PackageBackend):
+    name = 'dnf'
+    
+    def __init__(self) -> None:
+        self._base = None
+        self._stamp: Optional[str] = None
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def is_available() -> bool:
+        return _load_dnf()
+    
+    def _get_base(self):
+        stamp = get_metadata_stamp() + get_rpmdb_stamp()
+        if self._base is not None and stamp == self._stamp:
+            return self._base
+        
+        if self._base is not None:
+            logger.debug("Package state changed, reloading DNF sack")
+            self._base.close()
+        
+        cache_only = not is_dnf5() and metadata_is_fresh()
+        logger.debug(f"Loading DNF sack{' from cache' if cache_only else ''}")
+        try:
+            try:
+                base = self._load_base(cache_only)
+            except dnf.exceptions.Error:
+                if not cache_only:
+                    raise
+                logger.debug("Cached metadata not usable, loading DNF sack with a refresh")
+                base = self._load_base(False)
+        except Exception as e:
+            self._base = None
+            logger.error(f"Failed to load DNF sack: {e}")
+            raise BackendUnavailable(str(e))
+        
+        self._base = base
+        self._stamp = stamp
+        return base
+    
+    @staticmethod
+    def _load_base(cache_only: bool):
+        base = dnf.Base()
+        base.conf.read()
+        if os.geteuid() != 0:
+            base.conf.cachedir = dnf.yum.misc.getCacheDir()
+        base.conf.cacheonly = cache_only
+        base.read_all_repos()
+        try:
+            base.fill_sack(load_system_repo=True, load_available_repos=True)
+        except Exception:
+            base.close()
+            raise
+        return base
+    
+    def reload(self) -> None:
+        with self._lock:
+            if self._base is not None:
+                self._base.close()
+            self._base = None
+            self._stamp = None
+    
+    def search(self, query: str, cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
+        terms = query.split()
+        if not terms:
+            return []
+        
+        with self._lock:
+            sack = self._get_base().sack
+            packages_q = sack.query().filter(arch__neq='src')
+            installed = self._installed_versions(sack)
+            
+            matches = None
+            for term in terms:
+                term_q = packages_q.filter(hawkey.ICASE, name__substr=term).union(
+                    packages_q.filter(hawkey.ICASE, summary__substr=term)
+                )
+                matches = term_q if matches is None else matches.intersection(term_q)
+            
+            packages = []
+            seen = set()
+            for pkg in matches.latest():
+                if pkg.name.lower() in seen:
+                    continue
+                seen.add(pkg.name.lower())
+                packages.append({
+                    'name': pkg.name,
+                    'display_name': pkg.name,
+                    'summary': pkg.summary,
+                    'version': pkg.evr,
+                    'installed': pkg.name in installed,
+                    'installed_version': installed.get(pkg.name)
+                })
+        
+        if cancellable:
+            cancellable.raise_if_cancelled()
+        
+        logger.info(f"Found {len(packages)} packages for query: {query}")
+        return packages
+    
+    def get_info(self, package_name: str) -> Dict[str, Any]:
+        base_name = extract_base_name(package_name)
+        
+        with self._lock:
+            name_q = self._get_base().sack.query().filter(name=base_name, arch__neq='src')
+            installed = list(name_q.installed())
+            available = list(name_q.available().latest())
+            
+            if not installed and not available:
+                raise Exception('Package not found')
+            
+            pkg = available[0] if available else installed[0]
+            size = pkg.size if available else pkg.installsize
+            repository = pkg.reponame if available else getattr(pkg, 'from_repo', None)
+            
+            return {
+                'name': pkg.name,
+                'version': pkg.version,
+                'release': pkg.release,
+                'architecture': pkg.arch,
+                'size': format_size(size),
+                'summary': pkg.summary,
+                'description': pkg.description,
+                'url': pkg.url,
+                'license': pkg.license,
+                'repository': repository or None,
+                'installed': bool(installed)
+            }
+    
+    def get_installed(self) -> List[Dict[str, Any]]:
+        return get_installed_packages()
+    
+    def get_installed_versions(self) -> Dict[str, str]:
+        return get_installed_versions()
+    
+    @staticmethod
+    def _installed_versions(sack) -> Dict[str, str]:
+        return {pkg.name: f'{pkg.version}-{pkg.release}' for pkg in sack.query().installed()}
+    
+    def list_package_names(self) -> List[str]:
+        with self._lock:
+            return list({pkg.name for pkg in self._get_base().sack.query().filter(arch__neq='src')})
+    
+    def check_updates(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            sack = self._get_base().sack
+            current = {pkg.name: pkg for pkg in sack.query().installed()}
+            
+            updates = []
+            seen = set()
+            for pkg in sack.query().upgrades().filter(arch__neq='src').latest():
+                if pkg.name.lower() in seen:
+                    continue
+                seen.add(pkg.name.lower())
+                installed = current.get(pkg.name)
+                updates.append({
+                    'name': pkg.name,
+                    'display_name': pkg.name,
+                    'current_version': f'{installed.version}-{installed.release}' if installed else None,
+                    'available_version': pkg.evr,
+                    'summary': pkg.summary
+                })
+        
+        logger.info(f"Found {len(updates)} available updates")
+        return sorted(updates, key=lambda x: x['name'].lower())
@@ -0,0 +1,36 @@
+from typing import Callable, List, Dict, Any, Optional
+
+from src.handlers.backends.base import PackageBackend
+from src.handlers.search import search_packages, stream_search_packages, package_index
+from src.handlers.info import get_package_info
+from src.handlers.installed import get_installed_packages, get_installed_versions
+from src.handlers.updates import check_updates
+from src.utils import Cancellable
+
+
+class SubprocessBackend(PackageBackend):
+    name = 'subprocess'
+    
+    def search(self, query: str, cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
+        return search_packages(query, cancellable)
+    
+    def search_stream(self, query: str, on_batch: Callable[[List[Dict[str, Any]]], None],
+                      cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
+        return stream_search_packages(query, on_batch, cancellable)
+    
+    def get_info(self, package_name: str) -> Dict[str, Any]:
+        return get_package_info(package_name)
+    
+    def get_installed(self) -> List[Dict[str, Any]]:
+        return get_installed_packages()
+    
+    def get_installed_versions(self) -> Dict[str, str]:
+        return get_installed_versions()
+    
+    def list_package_names(self) -> List[str]:
+        if package_index.is_ready():
+            return package_index.all_names()
+        return list(get_installed_versions())
+    
+    def check_updates(self) -> List[Dict[str, Any]]:
+        return check_updates()
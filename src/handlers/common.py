@@ -1,8 +1,13 @@
 import os
+import shutil
 import subprocess
-from typing import Dict, Optional, Tuple, Any
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
-from src.utils import clean_package_name
+from src.utils import clean_package_name, Cancellable, CancelledError
+from src.scheduler import current_cancellable, current_priority, PRIORITY_IDLE
+from src.handlers.metadata import cache_only, needs_metadata
+from src.handlers import rpmdb
 from src.core.logger import logger
 
 
@@ -40,7 +45,8 @@ def create_package_dict(name: str, summary: Optional[str]) -> Optional[Dict[str,
         'display_name': display_name,
         'summary': summary,
         'version': None,
-        'installed': False
+        'installed': False,
+        'installed_version': None
     }
 
 
@@ -51,6 +57,12 @@ def extract_value(line: str) -> Optional[str]:
 
 
 def check_installed_status(package_name: str) -> bool:
+    if rpmdb.is_available():
+        try:
+            return rpmdb.is_installed(package_name)
+        except Exception as e:
+            logger.debug(f"rpm database lookup failed for {package_name}: {e}")
+    
     try:
         result = subprocess.run(
             ['rpm', '-q', package_name],
@@ -64,6 +76,143 @@ def check_installed_status(package_name: str) -> bool:
         return False
 
 
+def format_size(size: Optional[int]) -> Optional[str]:
+    if size is None:
+        return None
+    value = float(size)
+    for unit in ['k', 'M', 'G']:
+        value /= 1024
+        if value < 1024:
+            return f'{value:.1f} {unit}'
+    return f'{value / 1024:.1f} T'
+
+
+def low_priority(args: List[str]) -> List[str]:
+    prefix = []
+    if shutil.which('nice'):
+        prefix += ['nice', '-n', '19']
+    if shutil.which('ionice'):
+        prefix += ['ionice', '-c', '3']
+    return prefix + args
+
+
+def _for_current_task(args: List[str]) -> List[str]:
+    return low_priority(args) if current_priority() == PRIORITY_IDLE else args
+
+
+def run_command(args: List[str], timeout: Optional[float] = None, check: bool = False,
+                cancellable: Optional[Cancellable] = None,
+                env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+    cancellable = cancellable or current_cancellable()
+    process = subprocess.Popen(
+        _for_current_task(args),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env
+    )
+    if cancellable:
+        cancellable.attach_process(process)
+    
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise
+    finally:
+        if cancellable:
+            cancellable.detach_process(process)
+    
+    if cancellable and cancellable.is_cancelled:
+        raise CancelledError('Operation cancelled')
+    if check and process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, args, stdout, stderr)
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+
+def run_dnf(args: List[str], timeout: Optional[float] = None,
+            cancellable: Optional[Cancellable] = None) -> subprocess.CompletedProcess:
+    cached_args = cache_only(args)
+    env = get_dnf_env()
+    result = run_command(cached_args, timeout=timeout, cancellable=cancellable, env=env)
+    if cached_args is not args and needs_metadata(result.returncode, result.stdout + result.stderr):
+        logger.debug(f"Cached metadata not usable for {' '.join(args[:2])}, retrying with a refresh")
+        result = run_command(args, timeout=timeout, cancellable=cancellable, env=env)
+    return result
+
+
+def stream_command(args: List[str], on_line: Callable[[str], None], timeout: Optional[float] = None,
+                   cancellable: Optional[Cancellable] = None, env: Optional[Dict[str, str]] = None,
+                   stderr: int = subprocess.STDOUT,
+                   on_error_line: Optional[Callable[[str], None]] = None) -> int:
+    cancellable = cancellable or current_cancellable()
+    process = subprocess.Popen(
+        _for_current_task(args),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if on_error_line else stderr,
+        text=True,
+        bufsize=1,
+        env=env
+    )
+    if cancellable:
+        cancellable.attach_process(process)
+    
+    def drain_stderr():
+        for line in process.stderr:
+            on_error_line(line.rstrip('\n'))
+    
+    reader = threading.Thread(target=drain_stderr, daemon=True) if on_error_line else None
+    if reader:
+        reader.start()
+    
+    timed_out = threading.Event()
+    
+    def on_timeout():
+        timed_out.set()
+        process.kill()
+    
+    timer = threading.Timer(timeout, on_timeout) if timeout else None
+    if timer:
+        timer.daemon = True
+        timer.start()
+    
+    try:
+        for line in process.stdout:
+            on_line(line.rstrip('\n'))
+        returncode = process.wait()
+    finally:
+        if timer:
+            timer.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        if reader:
+            reader.join()
+            process.stderr.close()
+        if cancellable:
+            cancellable.detach_process(process)
+    
+    if cancellable and cancellable.is_cancelled:
+        raise CancelledError('Operation cancelled')
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(args, timeout)
+    return returncode
+
+
+def get_unbuffered_env() -> Dict[str, str]:
+    env = os.environ.copy()
+    env['PYTHONUNBUFFERED'] = '1'
+    return env
+
+
+def get_dnf_env() -> Dict[str, str]:
+    env = get_unbuffered_env()
+    env['LC_ALL'] = 'C'
+    return env
+
+
 def get_polkit_env() -> Dict[str, str]:
     env = os.environ.copy()
     if 'DISPLAY' not in env:
@@ -1,15 +1,218 @@
-from src.handlers.search import search_packages
-from src.handlers.installed import get_installed_packages
-from src.handlers.updates import check_updates, update_system
-from src.handlers.install import install_package, uninstall_package
-from src.handlers.info import get_package_info
+import threading
+from typing import Callable, List, Dict, Any, Optional, Tuple
+
+from gi.repository import Gio, GLib
+
+from src.handlers.common import extract_base_name
+from src.handlers.transaction import ProgressCallback
+from src.utils import Cancellable, run_in_thread
+from src.scheduler import current_cancellable
+from src.cache import info_cache
+
+
+_suggester_lock = threading.Lock()
+_suggester_cache: Dict[str, Any] = {'names': None, 'suggester': None}
+
+
+def _call_backend(method: str, *args: Any) -> Any:
+    from src.handlers.backends import get_backend, fall_back_to_subprocess, BackendUnavailable
+    
+    try:
+        return getattr(get_backend(), method)(*args)
+    except BackendUnavailable:
+        return getattr(fall_back_to_subprocess(), method)(*args)
+
+
+def search_packages(query: str, cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
+    from src.handlers.search.ranking import rank_packages
+    
+    return rank_packages(_call_backend('search', query, cancellable), query)
+
+
+def stream_search_packages(query: str, on_batch: Callable[[List[Dict[str, Any]]], None],
+                           cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
+    from src.handlers.search.ranking import rank_packages
+    
+    return rank_packages(_call_backend('search_stream', query, on_batch, cancellable), query)
+
+
+def suggest_package_names(query: str) -> List[str]:
+    from src.handlers.search.fuzzy import NameSuggester
+    
+    names = sorted(_call_backend('list_package_names'))
+    with _suggester_lock:
+        if _suggester_cache['names'] != names:
+            _suggester_cache['names'] = names
+            _suggester_cache['suggester'] = NameSuggester(names)
+        return _suggester_cache['suggester'].suggest(query)
+
+
+def refresh_search_index() -> None:
+    from src.handlers.backends import get_backend, SubprocessBackend
+    from src.handlers.search import package_index
+    
+    if isinstance(get_backend(), SubprocessBackend):
+        package_index.ensure_fresh()
+
+
+def get_installed_packages() -> List[Dict[str, Any]]:
+    return _call_backend('get_installed')
+
+
+def check_updates() -> List[Dict[str, Any]]:
+    return _call_backend('check_updates')
+
+
+def search_index(query: str) -> Optional[List[Dict[str, Any]]]:
+    from src.handlers.backends import get_backend, SubprocessBackend
+    from src.handlers.search.search import search_index as search_package_index
+    from src.handlers.search.ranking import rank_packages
+    
+    if not isinstance(get_backend(), SubprocessBackend):
+        return None
+    packages = search_package_index(query)
+    return None if packages is None else rank_packages(packages, query)
+
+
+def get_package_info(package_name: str) -> Dict[str, Any]:
+    return info_cache.get_or_fetch(
+        extract_base_name(package_name),
+        lambda: _call_backend('get_info', package_name)
+    )
+
+
+def update_system(on_progress: ProgressCallback = None) -> Tuple[bool, str]:
+    from src.handlers.updates import updates
+    
+    return updates.update_system(on_progress)
+
+
+def install_package(package_name: str, on_progress: ProgressCallback = None) -> Tuple[bool, str]:
+    from src.handlers.install import install
+    
+    return install.install_package(package_name, on_progress)
+
+
+def uninstall_package(package_name: str, on_progress: ProgressCallback = None) -> Tuple[bool, str]:
+    from src.handlers.install import install
+    
+    return install.uninstall_package(package_name, on_progress)
+
+
+def apply_transaction(install_names: List[str], remove_names: List[str],
+                      on_progress: ProgressCallback = None) -> Tuple[bool, str]:
+    from src.handlers.install import install
+    
+    return install.apply_transaction(install_names, remove_names, on_progress)
+
+
+def _uses_subprocess_backend() -> bool:
+    from src.handlers.backends import current_backend, SubprocessBackend
+    
+    return isinstance(current_backend(), SubprocessBackend)
+
+
+def search_packages_async(query: str, on_batch: Callable[[List[Dict[str, Any]]], None],
+                          callback: Callable[[List[Dict[str, Any]]], None],
+                          error_callback: Optional[Callable[[str], None]] = None, owner: Optional[Any] = None) -> Any:
+    if not _uses_subprocess_backend():
+        return run_in_thread(
+            lambda: stream_search_packages(query, lambda batch: GLib.idle_add(on_batch, batch), current_cancellable()),
+            callback,
+            error_callback,
+            owner=owner
+        )
+    
+    from src.handlers import async_api
+    from src.handlers.search.ranking import rank_packages
+    
+    cancellable = Gio.Cancellable()
+    async_api.search_packages_async(
+        query,
+        lambda packages: callback(rank_packages(packages, query)),
+        error_callback,
+        on_batch,
+        cancellable
+    )
+    return cancellable
+
+
+def get_installed_packages_async(callback: Callable[[List[Dict[str, Any]]], None],
+                                 error_callback: Optional[Callable[[str], None]] = None,
+                                 owner: Optional[Any] = None) -> Any:
+    if not _uses_subprocess_backend():
+        return run_in_thread(get_installed_packages, callback, error_callback, owner=owner)
+    
+    from src.handlers import async_api
+    
+    cancellable = Gio.Cancellable()
+    async_api.get_installed_packages_async(callback, error_callback, cancellable)
+    return cancellable
+
+
+def check_updates_async(callback: Callable[[List[Dict[str, Any]]], None],
+                        error_callback: Optional[Callable[[str], None]] = None,
+                        owner: Optional[Any] = None) -> Any:
+    if not _uses_subprocess_backend():
+        return run_in_thread(check_updates, callback, error_callback, owner=owner)
+    
+    from src.handlers import async_api
+    
+    cancellable = Gio.Cancellable()
+    async_api.check_updates_async(callback, error_callback, cancellable)
+    return cancellable
+
+
+def get_package_info_async(package_name: str, callback: Callable[[Dict[str, Any]], None],
+                           error_callback: Optional[Callable[[str], None]] = None,
+                           cancellable: Optional[Any] = None, owner: Optional[Any] = None) -> None:
+    key = extract_base_name(package_name)
+    cached = info_cache.peek(key)
+    if cached is not None:
+        callback(cached)
+        return
+    
+    from src.handlers import async_api
+    
+    if not _uses_subprocess_backend():
+        run_in_thread(lambda: get_package_info(package_name), callback, error_callback, owner=owner)
+        return
+    
+    def deliver(func: Callable[[Any], None], value: Any) -> bool:
+        if cancellable is None or not cancellable.is_cancelled():
+            func(value)
+        return False
+    
+    flight = info_cache.join_or_start(
+        key,
+        lambda info: GLib.idle_add(deliver, callback, info),
+        lambda error_msg: GLib.idle_add(deliver, error_callback, error_msg) if error_callback else None
+    )
+    if flight is None:
+        return
+    
+    async_api.get_package_info_async(
+        package_name,
+        lambda info: info_cache.finish(key, flight, info),
+        lambda error_msg: info_cache.finish(key, flight, error=Exception(error_msg))
+    )
+
 
 __all__ = [
     'search_packages',
+    'stream_search_packages',
+    'suggest_package_names',
+    'refresh_search_index',
+    'search_index',
+    'search_packages_async',
     'get_installed_packages',
+    'get_installed_packages_async',
     'check_updates',
+    'check_updates_async',
     'update_system',
     'install_package',
     'uninstall_package',
-    'get_package_info'
+    'apply_transaction',
+    'get_package_info',
+    'get_package_info_async'
 ]
@@ -1,11 +1,9 @@
 import subprocess
 from typing import Dict, Any, Optional
 
-from src.handlers.common import (
-    extract_base_name,
-    extract_value,
-    check_installed_status
-)
+from src.handlers.common import extract_base_name, extract_value, run_command, run_dnf
+from src.handlers.installed import get_installed_versions
+from src.utils import CancelledError
 from src.core.logger import logger
 
 
@@ -15,25 +13,21 @@ def get_package_info(package_name: str) -> Dict[str, Any]:
     try:
         base_name = extract_base_name(package_name)
         
-        result = subprocess.run(
-            ['dnf', 'info', base_name],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=10
-        )
+        result = run_dnf(['dnf', 'info', base_name], timeout=10)
         
         if result.returncode != 0:
             logger.debug(f"DNF info failed, trying RPM info for: {base_name}")
             return _try_rpm_info(base_name)
         
-        info = _parse_dnf_info(result.stdout, base_name)
+        info = parse_dnf_info(result.stdout, base_name)
         logger.debug(f"Successfully retrieved info for: {package_name}")
         return info
         
     except subprocess.TimeoutExpired:
         logger.error(f"Package info lookup timed out for: {package_name}")
         raise Exception('Package info lookup timed out')
+    except CancelledError:
+        raise
     except Exception as e:
         if 'Package not found' in str(e):
             logger.warning(f"Package not found: {package_name}")
@@ -44,17 +38,11 @@ def get_package_info(package_name: str) -> Dict[str, Any]:
 
 def _try_rpm_info(base_name: str) -> Dict[str, Any]:
     try:
-        rpm_result = subprocess.run(
-            ['rpm', '-qi', base_name],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=10
-        )
+        rpm_result = run_command(['rpm', '-qi', base_name], timeout=10)
         
         if rpm_result.returncode == 0:
             logger.debug(f"Found package info via RPM for: {base_name}")
-            return _parse_rpm_info(rpm_result.stdout, base_name)
+            return parse_rpm_info(rpm_result.stdout, base_name)
         else:
             logger.warning(f"Package not found via RPM: {base_name}")
             raise Exception('Package not found')
@@ -66,7 +54,7 @@ def _try_rpm_info(base_name: str) -> Dict[str, Any]:
         raise
 
 
-def _parse_dnf_info(output: str, base_name: str) -> Dict[str, Any]:
+def parse_dnf_info(output: str, base_name: str, versions: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     info = {
         'name': base_name,
         'version': None,
@@ -118,12 +106,12 @@ def _parse_dnf_info(output: str, base_name: str) -> Dict[str, Any]:
             description_lines.append(line)
     
     info['description'] = '\n'.join(description_lines) if description_lines else None
-    info['installed'] = check_installed_status(base_name)
+    info['installed'] = base_name in (versions if versions is not None else get_installed_versions())
     
     return info
 
 
-def _parse_rpm_info(output: str, package_name: str) -> Dict[str, Any]:
+def parse_rpm_info(output: str, package_name: str) -> Dict[str, Any]:
     info = {
         'name': package_name,
         'version': None,
@@ -1,4 +1,4 @@
-from src.handlers.install.install import install_package, uninstall_package
+from src.handlers.install.install import install_package, uninstall_package, apply_transaction
 
-__all__ = ['install_package', 'uninstall_package']
+__all__ = ['install_package', 'uninstall_package', 'apply_transaction']
 
@@ -1,32 +1,32 @@
+import os
 import subprocess
-from typing import Tuple
+import tempfile
+from typing import List, Tuple
 
-from src.handlers.common import extract_base_name, get_polkit_env
+from src.handlers.common import extract_base_name
+from src.utils import clean_package_name
+from src.handlers.metadata import is_dnf5
+from src.handlers.transaction import run_transaction, ProgressCallback
 from src.core.logger import logger
 
 
-def install_package(package_name: str) -> Tuple[bool, str]:
+def install_package(package_name: str, on_progress: ProgressCallback = None) -> Tuple[bool, str]:
     logger.info(f"Installing package: {package_name}")
     
     try:
         base_name = extract_base_name(package_name)
-        env = get_polkit_env()
-        
-        result = subprocess.run(
-            ['pkexec', 'dnf', 'install', '-y', base_name],
-            capture_output=True,
-            text=True,
-            timeout=300,
-            env=env
+        success, output = run_transaction(
+            ['dnf', 'install', '-y', base_name],
+            on_progress,
+            timeout=300
         )
         
-        if result.returncode == 0:
+        if success:
             logger.info(f"Successfully installed: {package_name}")
-            return True, result.stdout
+            return True, output
         else:
-            error_msg = result.stderr if result.stderr else result.stdout
-            logger.error(f"Installation failed for {package_name}: {error_msg}")
-            return False, error_msg or 'Installation failed'
+            logger.error(f"Installation failed for {package_name}: {output}")
+            return False, output or 'Installation failed'
             
     except subprocess.TimeoutExpired:
         logger.error(f"Installation timed out for: {package_name}")
@@ -39,28 +39,23 @@ def install_package(package_name: str) -> Tuple[bool, str]:
         return False, f'Installation error: {str(e)}'
 
 
-def uninstall_package(package_name: str) -> Tuple[bool, str]:
+def uninstall_package(package_name: str, on_progress: ProgressCallback = None) -> Tuple[bool, str]:
     logger.info(f"Uninstalling package: {package_name}")
     
     try:
         base_name = extract_base_name(package_name)
-        env = get_polkit_env()
-        
-        result = subprocess.run(
-            ['pkexec', 'dnf', 'remove', '-y', base_name],
-            capture_output=True,
-            text=True,
-            timeout=300,
-            env=env
+        success, output = run_transaction(
+            ['dnf', 'remove', '-y', base_name],
+            on_progress,
+            timeout=300
         )
         
-        if result.returncode == 0:
+        if success:
             logger.info(f"Successfully uninstalled: {package_name}")
-            return True, result.stdout
+            return True, output
         else:
-            error_msg = result.stderr if result.stderr else result.stdout
-            logger.error(f"Uninstallation failed for {package_name}: {error_msg}")
-            return False, error_msg or 'Uninstallation failed'
+            logger.error(f"Uninstallation failed for {package_name}: {output}")
+            return False, output or 'Uninstallation failed'
             
     except subprocess.TimeoutExpired:
         logger.error(f"Uninstallation timed out for: {package_name}")
@@ -71,3 +66,59 @@ def uninstall_package(package_name: str) -> Tuple[bool, str]:
     except Exception as e:
         logger.error(f"Uninstallation error for {package_name}: {e}")
         return False, f'Uninstallation error: {str(e)}'
+
+
+def _write_shell_script(install: List[str], remove: List[str]) -> str:
+    fd, path = tempfile.mkstemp(prefix='fedar-transaction-', suffix='.dnf')
+    with os.fdopen(fd, 'w') as f:
+        if install:
+            f.write(f"install {' '.join(install)}\n")
+        if remove:
+            f.write(f"remove {' '.join(remove)}\n")
+        f.write('run\n')
+    os.chmod(path, 0o644)
+    return path
+
+
+def apply_transaction(install: List[str], remove: List[str],
+                      on_progress: ProgressCallback = None) -> Tuple[bool, str]:
+    install = [clean_package_name(name) for name in install]
+    remove = [clean_package_name(name) for name in remove]
+    logger.info(f"Applying transaction: install {install}, remove {remove}")
+    
+    if not install and not remove:
+        return True, ''
+    
+    script = None
+    try:
+        if not remove:
+            args = ['dnf', 'install', '-y', *install]
+        elif not install:
+            args = ['dnf', 'remove', '-y', *remove]
+        elif is_dnf5():
+            args = ['dnf', 'do', '-y', '--action=install', *install, '--action=remove', *remove]
+        else:
+            script = _write_shell_script(install, remove)
+            args = ['dnf', 'shell', '-y', script]
+        
+        success, output = run_transaction(args, on_progress, timeout=1800)
+        
+        if success:
+            logger.info("Transaction completed successfully")
+            return True, output
+        else:
+            logger.error(f"Transaction failed: {output}")
+            return False, output or 'Transaction failed'
+            
+    except subprocess.TimeoutExpired:
+        logger.error("Transaction timed out")
+        return False, 'Transaction timed out'
+    except FileNotFoundError:
+        logger.error("pkexec not found")
+        return False, 'pkexec not found. Please install polkit.'
+    except Exception as e:
+        logger.error(f"Transaction error: {e}")
+        return False, f'Transaction error: {str(e)}'
+    finally:
+        if script:
+            os.unlink(script)
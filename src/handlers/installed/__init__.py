@@ -1,4 +1,8 @@
-from src.handlers.installed.installed import get_installed_packages
+from src.handlers.installed.installed import (
+    get_installed_packages,
+    get_installed_versions,
+    annotate_installed
+)
 
-__all__ = ['get_installed_packages']
+__all__ = ['get_installed_packages', 'get_installed_versions', 'annotate_installed']
 
@@ -1,48 +1,43 @@
+import marshal
+import os
 import subprocess
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional
 
-from src.utils import clean_package_name
+from gi.repository import GLib
+
+from src.utils import clean_package_name, CancelledError
+from src.handlers.common import run_command
+from src.handlers.metadata import get_rpmdb_stamp
+from src.handlers import rpmdb
 from src.core.logger import logger
 
 
+INSTALLED_QUERY = ['rpm', '-qa', '--queryformat', '%{NAME}\t%{VERSION}\t%{RELEASE}\t%{SUMMARY}\n']
+VERSIONS_QUERY = ['rpm', '-qa', '--queryformat', '%{NAME}\t%{VERSION}-%{RELEASE}\n']
+
+SNAPSHOT_FILE = os.path.join(GLib.get_user_cache_dir(), 'fedar', 'installed.marshal')
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FIELDS = ('name', 'display_name', 'version', 'release', 'summary')
+
+_versions_lock = threading.Lock()
+_versions_cache: Dict[str, Any] = {'stamp': None, 'versions': {}}
+
+
 def get_installed_packages() -> List[Dict[str, Any]]:
     logger.debug("Fetching installed packages")
     
+    stamp = get_rpmdb_stamp()
+    packages = load_installed_snapshot(stamp)
+    if packages is not None:
+        logger.info(f"Loaded {len(packages)} installed packages from snapshot")
+        return packages
+    
     try:
-        result = subprocess.run(
-            ['rpm', '-qa', '--queryformat', '%{NAME}\t%{VERSION}\t%{RELEASE}\t%{SUMMARY}\n'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
-        
-        packages = []
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            parts = line.split('\t', 3)
-            if len(parts) < 2:
-                continue
-            
-            name = parts[0]
-            version = parts[1] if len(parts) > 1 else None
-            release = parts[2] if len(parts) > 2 else None
-            summary = parts[3] if len(parts) > 3 else None
-            display_name = clean_package_name(name)
-            
-            packages.append({
-                'name': name,
-                'display_name': display_name,
-                'version': version,
-                'release': release,
-                'summary': summary
-            })
-        
+        packages = _read_installed()
+        save_installed_snapshot(stamp, packages)
         logger.info(f"Found {len(packages)} installed packages")
-        return sorted(packages, key=lambda x: x['name'].lower())
+        return packages
         
     except subprocess.TimeoutExpired:
         logger.error("Timeout while fetching installed packages")
@@ -50,6 +45,150 @@ def get_installed_packages() -> List[Dict[str, Any]]:
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to get installed packages: {e}")
         raise Exception(f'Failed to get installed packages: {str(e)}')
+    except CancelledError:
+        raise
     except Exception as e:
         logger.error(f"Unexpected error getting installed packages: {e}")
         raise Exception(f'Failed to get installed packages: {str(e)}')
+
+
+def _read_installed() -> List[Dict[str, Any]]:
+    if rpmdb.is_available():
+        try:
+            return build_installed(rpmdb.query())
+        except Exception as e:
+            logger.warning(f"Reading the rpm database failed, falling back to rpm -qa: {e}")
+    
+    result = run_command(INSTALLED_QUERY, timeout=30, check=True)
+    return parse_installed(result.stdout)
+
+
+def build_installed(headers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    packages = [
+        {
+            'name': header['name'],
+            'display_name': clean_package_name(header['name']),
+            'version': header['version'],
+            'release': header['release'],
+            'summary': header['summary']
+        }
+        for header in headers
+    ]
+    return sorted(packages, key=lambda x: x['name'].lower())
+
+
+def parse_installed(output: str) -> List[Dict[str, Any]]:
+    packages = []
+    for line in output.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        
+        parts = line.split('\t', 3)
+        if len(parts) < 2:
+            continue
+        
+        name = parts[0]
+        version = parts[1] if len(parts) > 1 else None
+        release = parts[2] if len(parts) > 2 else None
+        summary = parts[3] if len(parts) > 3 else None
+        display_name = clean_package_name(name)
+        
+        packages.append({
+            'name': name,
+            'display_name': display_name,
+            'version': version,
+            'release': release,
+            'summary': summary
+        })
+    
+    return sorted(packages, key=lambda x: x['name'].lower())
+
+
+def load_installed_snapshot(stamp: str) -> Optional[List[Dict[str, Any]]]:
+    try:
+        with open(SNAPSHOT_FILE, 'rb') as f:
+            version, snapshot_stamp, rows = marshal.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable installed snapshot: {e}")
+        return None
+    
+    if version != SNAPSHOT_VERSION or snapshot_stamp != stamp:
+        return None
+    return [dict(zip(SNAPSHOT_FIELDS, row)) for row in rows]
+
+
+def save_installed_snapshot(stamp: str, packages: List[Dict[str, Any]]) -> None:
+    rows = [tuple(pkg[field] for field in SNAPSHOT_FIELDS) for pkg in packages]
+    try:
+        os.makedirs(os.path.dirname(SNAPSHOT_FILE), exist_ok=True)
+        tmp_path = f'{SNAPSHOT_FILE}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps((SNAPSHOT_VERSION, stamp, rows)))
+        os.replace(tmp_path, SNAPSHOT_FILE)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not save installed snapshot: {e}")
+
+
+def get_installed_versions() -> Dict[str, str]:
+    stamp = get_rpmdb_stamp()
+    with _versions_lock:
+        if _versions_cache['stamp'] == stamp:
+            return _versions_cache['versions']
+        
+        if rpmdb.is_available():
+            try:
+                versions = {}
+                for header in rpmdb.query():
+                    versions.setdefault(header['name'], f"{header['version']}-{header['release']}")
+                return _set_versions(stamp, versions)
+            except Exception as e:
+                logger.warning(f"Reading the rpm database failed, falling back to rpm -qa: {e}")
+        
+        try:
+            result = run_command(VERSIONS_QUERY, timeout=30, check=True)
+        except CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Could not read installed package versions: {e}")
+            return {}
+        
+        return _set_versions(stamp, _parse_versions(result.stdout))
+
+
+def get_cached_versions() -> Optional[Dict[str, str]]:
+    if _versions_cache['stamp'] == get_rpmdb_stamp():
+        return _versions_cache['versions']
+    return None
+
+
+def store_installed_versions(stamp: str, output: str) -> Dict[str, str]:
+    return _set_versions(stamp, _parse_versions(output))
+
+
+def _parse_versions(output: str) -> Dict[str, str]:
+    versions = {}
+    for line in output.split('\n'):
+        parts = line.strip().split('\t', 1)
+        if len(parts) == 2 and parts[0] not in versions:
+            versions[parts[0]] = parts[1]
+    return versions
+
+
+def _set_versions(stamp: str, versions: Dict[str, str]) -> Dict[str, str]:
+    _versions_cache['versions'] = versions
+    _versions_cache['stamp'] = stamp
+    logger.debug(f"Loaded installed versions for {len(versions)} packages")
+    return versions
+
+
+def annotate_installed(packages: List[Dict[str, Any]], versions: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    if versions is None:
+        versions = get_installed_versions()
+    for pkg in packages:
+        installed_version = versions.get(pkg['name'])
+        pkg['installed'] = installed_version is not None
+        pkg['installed_version'] = installed_version
+    return packages
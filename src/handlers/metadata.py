@@ -0,0 +1,129 @@
+import getpass
+import glob
+import hashlib
+import os
+import shutil
+from functools import lru_cache
+from time import time
+from typing import List, Optional
+
+from gi.repository import GLib
+
+from src.core.config import METADATA_CACHE_ONLY_MAX_AGE
+
+
+REPOS_DIR = '/etc/yum.repos.d'
+
+RPMDB_FILES = [
+    '/usr/lib/sysimage/rpm/rpmdb.sqlite',
+    '/usr/lib/sysimage/rpm/rpmdb.sqlite-wal',
+    '/var/lib/rpm/rpmdb.sqlite',
+    '/var/lib/rpm/rpmdb.sqlite-wal',
+    '/var/lib/rpm/Packages',
+]
+
+DNF4_SYSTEM_REPOMD = '/var/cache/dnf/*/repodata/repomd.xml'
+DNF5_SYSTEM_REPOMD = '/var/cache/libdnf5/*/repodata/repomd.xml'
+DNF4_USER_REPOMD = '/var/tmp/dnf-{user}-*/*/repodata/repomd.xml'
+DNF5_USER_REPOMD = os.path.join(GLib.get_user_cache_dir(), 'libdnf5', '*', 'repodata', 'repomd.xml')
+
+REPOMD_PATTERNS = [
+    DNF4_SYSTEM_REPOMD,
+    DNF5_SYSTEM_REPOMD,
+    DNF4_USER_REPOMD.format(user='*'),
+    DNF5_USER_REPOMD,
+]
+
+
+@lru_cache(maxsize=None)
+def is_dnf5() -> bool:
+    dnf_path = shutil.which('dnf')
+    return bool(dnf_path) and os.path.basename(os.path.realpath(dnf_path)).startswith('dnf5')
+
+
+def repomd_pattern(dnf5: bool, user: bool) -> str:
+    if not user:
+        return DNF5_SYSTEM_REPOMD if dnf5 else DNF4_SYSTEM_REPOMD
+    return DNF5_USER_REPOMD if dnf5 else DNF4_USER_REPOMD.format(user=getpass.getuser())
+
+
+def refreshed_cache_pattern() -> str:
+    return repomd_pattern(is_dnf5(), os.geteuid() != 0)
+
+
+def cache_only_reads_refreshed_cache() -> bool:
+    return is_dnf5() or os.geteuid() == 0
+
+
+def find_repomd_files() -> List[str]:
+    files = []
+    for pattern in REPOMD_PATTERNS:
+        files.extend(glob.glob(pattern))
+    return sorted(files)
+
+
+def get_metadata_age(pattern: Optional[str] = None) -> Optional[float]:
+    newest = None
+    for path in glob.glob(pattern) if pattern else find_repomd_files():
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        newest = mtime if newest is None else max(newest, mtime)
+    return None if newest is None else max(0.0, time() - newest)
+
+
+def metadata_is_fresh(pattern: Optional[str] = None) -> bool:
+    age = get_metadata_age(pattern or refreshed_cache_pattern())
+    return age is not None and age <= METADATA_CACHE_ONLY_MAX_AGE
+
+
+def cache_only(args: List[str]) -> List[str]:
+    if args[:1] != ['dnf'] or '-C' in args:
+        return args
+    if not cache_only_reads_refreshed_cache() or not metadata_is_fresh():
+        return args
+    return ['dnf', '-C', *args[1:]]
+
+
+def needs_metadata(returncode: int, output: str) -> bool:
+    output = output.lower()
+    return returncode not in (0, 100) and ('cache-only' in output or 'no cache' in output)
+
+
+def _stat_entries(paths: List[str]) -> List[str]:
+    entries = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append(f'{path}:{st.st_mtime_ns}:{st.st_size}')
+    return entries
+
+
+def get_repos_stamp() -> str:
+    paths = [REPOS_DIR]
+    try:
+        paths.extend(
+            os.path.join(REPOS_DIR, name)
+            for name in sorted(os.listdir(REPOS_DIR))
+            if name.endswith('.repo')
+        )
+    except OSError:
+        pass
+    return _digest(_stat_entries(paths))
+
+
+def get_rpmdb_stamp() -> str:
+    return _digest(_stat_entries(RPMDB_FILES))
+
+
+def get_metadata_stamp() -> str:
+    entries = _stat_entries(find_repomd_files())
+    entries.append(get_repos_stamp())
+    return _digest(entries)
+
+
+def _digest(entries: List[str]) -> str:
+    return hashlib.sha1('\n'.join(entries).encode()).hexdigest()
@@ -0,0 +1,73 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.core.logger import logger
+
+rpm = None
+_checked = False
+
+FIELDS = ('name', 'epoch', 'version', 'release', 'arch', 'summary', 'size', 'installtime')
+
+
+def _load_rpm() -> bool:
+    global rpm, _checked
+    if not _checked:
+        _checked = True
+        try:
+            import rpm
+        except ImportError:
+            rpm = None
+            logger.debug("rpm Python bindings not available, using the rpm CLI")
+    return rpm is not None
+
+
+def is_available() -> bool:
+    return _load_rpm()
+
+
+def _text(value: Any) -> Optional[str]:
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    return value
+
+
+def _tags():
+    return (
+        rpm.RPMTAG_NAME, rpm.RPMTAG_EPOCH, rpm.RPMTAG_VERSION, rpm.RPMTAG_RELEASE,
+        rpm.RPMTAG_ARCH, rpm.RPMTAG_SUMMARY, rpm.RPMTAG_SIZE, rpm.RPMTAG_INSTALLTIME
+    )
+
+
+def _transaction_set():
+    ts = rpm.TransactionSet()
+    ts.setVSFlags(rpm._RPMVSF_NOSIGNATURES | rpm._RPMVSF_NODIGESTS)
+    return ts
+
+
+def _read(match) -> List[Dict[str, Any]]:
+    tags = _tags()
+    packages = []
+    for header in match:
+        values = [_text(header[tag]) for tag in tags]
+        packages.append(dict(zip(FIELDS, values)))
+    return packages
+
+
+def query(names: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    if not _load_rpm():
+        raise Exception('rpm Python bindings are not available')
+    
+    ts = _transaction_set()
+    try:
+        if names is None:
+            return _read(ts.dbMatch())
+        
+        packages = []
+        for name in names:
+            packages.extend(_read(ts.dbMatch(rpm.RPMTAG_NAME, name)))
+        return packages
+    finally:
+        ts.closeDB()
+
+
+def is_installed(name: str) -> bool:
+    return bool(query([name]))
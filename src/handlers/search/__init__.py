@@ -1,4 +1,5 @@
-from src.handlers.search.search import search_packages
+from src.handlers.search.search import search_packages, stream_search_packages
+from src.handlers.search.index import package_index
 
-__all__ = ['search_packages']
+__all__ = ['search_packages', 'stream_search_packages', 'package_index']
 
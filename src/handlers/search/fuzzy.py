@@ -0,0 +1,70 @@
+from collections import Counter
+from typing import List, Dict, Sequence
+
+MAX_CANDIDATES = 200
+
+
+def _grams(word: str) -> List[str]:
+    padded = f'  {word} '
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    
+    before_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            )
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, before_previous[j - 2] + 1)
+            current.append(cost)
+        if min(current) > max_distance:
+            return max_distance + 1
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+def max_distance_for(query: str) -> int:
+    if len(query) <= 4:
+        return 1
+    if len(query) <= 9:
+        return 2
+    return 3
+
+
+class NameSuggester:
+    def __init__(self, names: Sequence[str]) -> None:
+        self.names = sorted({name.lower() for name in names})
+        self.postings: Dict[str, List[int]] = {}
+        for name_id, name in enumerate(self.names):
+            for gram in set(_grams(name)):
+                self.postings.setdefault(gram, []).append(name_id)
+    
+    def suggest(self, query: str, limit: int = 3) -> List[str]:
+        query = query.strip().lower()
+        if not query:
+            return []
+        
+        counts: Counter = Counter()
+        for gram in set(_grams(query)):
+            counts.update(self.postings.get(gram, ()))
+        
+        max_distance = max_distance_for(query)
+        scored = []
+        for name_id, _ in counts.most_common(MAX_CANDIDATES):
+            name = self.names[name_id]
+            if name == query:
+                continue
+            distance = edit_distance(query, name, max_distance)
+            if distance <= max_distance:
+                scored.append((distance, len(name), name))
+        
+        return [name for _, _, name in sorted(scored)[:limit]]
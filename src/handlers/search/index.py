@@ -0,0 +1,214 @@
+import os
+import sqlite3
+import subprocess
+import threading
+from time import time
+from typing import List, Dict, Any, Optional
+
+from gi.repository import GLib
+
+from src.handlers.metadata import get_metadata_stamp
+from src.scheduler import scheduler, PRIORITY_BACKGROUND
+from src.core.config import PACKAGE_INDEX_MAX_AGE, PACKAGE_INDEX_CHECK_INTERVAL
+from src.core.logger import logger
+
+
+INDEX_DIR = os.path.join(GLib.get_user_cache_dir(), 'fedar')
+INDEX_FILE = os.path.join(INDEX_DIR, 'packages.db')
+
+FIELD_SEP = '\x1f'
+RECORD_SEP = '\x1e'
+QUERY_FORMAT = FIELD_SEP.join([
+    '%{name}', '%{arch}', '%{evr}', '%{repoid}', '%{summary}', '%{description}'
+]) + RECORD_SEP
+
+SCHEMA = [
+    "CREATE VIRTUAL TABLE packages USING fts5("
+    "name, summary, description UNINDEXED, arch UNINDEXED, version UNINDEXED, repo UNINDEXED, "
+    "tokenize='trigram')",
+    "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)",
+]
+
+
+class PackageIndex:
+    def __init__(self, path: str = INDEX_FILE) -> None:
+        self.path = path
+        self._build_lock = threading.Lock()
+        self._ready: Optional[bool] = None
+        self._stale = True
+        self._checked_at = 0.0
+        self._queued = False
+        self._failed_stamp: Optional[str] = None
+    
+    def _check(self) -> None:
+        if self._ready is not None and time() - self._checked_at < PACKAGE_INDEX_CHECK_INTERVAL:
+            return
+        
+        meta = None
+        if os.path.exists(self.path):
+            try:
+                meta = self._read_meta()
+            except sqlite3.Error as e:
+                logger.debug(f"Package index unreadable: {e}")
+        
+        self._ready = meta is not None
+        self._stale = meta is None or self._is_stale(meta)
+        self._checked_at = time()
+    
+    def is_ready(self) -> bool:
+        self._check()
+        return self._ready
+    
+    def is_stale(self) -> bool:
+        self._check()
+        return self._stale
+    
+    def _is_stale(self, meta: Dict[str, str]) -> bool:
+        built_at = float(meta.get('built_at', 0))
+        if time() - built_at > PACKAGE_INDEX_MAX_AGE:
+            return True
+        return meta.get('metadata_stamp') != get_metadata_stamp()
+    
+    def _read_meta(self) -> Dict[str, str]:
+        conn = sqlite3.connect(self.path)
+        try:
+            return dict(conn.execute('SELECT key, value FROM meta'))
+        finally:
+            conn.close()
+    
+    def build(self) -> int:
+        if not self._build_lock.acquire(blocking=False):
+            logger.debug("Package index build already running")
+            self._queued = False
+            return 0
+        
+        try:
+            logger.info("Building package index")
+            result = subprocess.run(
+                ['dnf', 'repoquery', '--quiet', '--latest-limit=1', '--queryformat', QUERY_FORMAT],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=300
+            )
+            
+            rows = []
+            for record in result.stdout.split(RECORD_SEP):
+                fields = record.strip('\n').split(FIELD_SEP)
+                if len(fields) < 6 or not fields[0]:
+                    continue
+                name, arch, version, repo, summary, description = fields[:6]
+                rows.append((name, summary, description, arch, version, repo))
+            
+            self._write(rows, get_metadata_stamp())
+            self._ready = True
+            self._stale = False
+            self._checked_at = time()
+            self._failed_stamp = None
+            logger.info(f"Package index built with {len(rows)} packages")
+            return len(rows)
+        except subprocess.TimeoutExpired:
+            logger.error("Package index build timed out")
+            self._failed_stamp = get_metadata_stamp()
+            return 0
+        except (subprocess.CalledProcessError, OSError, sqlite3.Error) as e:
+            logger.error(f"Failed to build package index: {e}")
+            self._failed_stamp = get_metadata_stamp()
+            return 0
+        finally:
+            self._queued = False
+            self._build_lock.release()
+    
+    def _write(self, rows: List[tuple], stamp: str) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        
+        conn = sqlite3.connect(tmp_path)
+        try:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.executemany(
+                'INSERT INTO packages (name, summary, description, arch, version, repo) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            conn.executemany(
+                'INSERT INTO meta (key, value) VALUES (?, ?)',
+                [('metadata_stamp', stamp), ('built_at', str(time()))]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        
+        os.replace(tmp_path, self.path)
+    
+    def build_in_background(self) -> None:
+        if self._queued or self._build_lock.locked():
+            return
+        if self._failed_stamp is not None and self._failed_stamp == get_metadata_stamp():
+            return
+        self._queued = True
+        scheduler.submit(self.build, priority=PRIORITY_BACKGROUND)
+    
+    def ensure_fresh(self) -> None:
+        if self.is_stale():
+            self.build_in_background()
+    
+    def all_names(self) -> List[str]:
+        conn = sqlite3.connect(self.path)
+        try:
+            return [row[0] for row in conn.execute('SELECT DISTINCT name FROM packages')]
+        finally:
+            conn.close()
+    
+    def search(self, query: str, limit: int = 500) -> List[Dict[str, Any]]:
+        terms = query.split()
+        match_terms = [term for term in terms if len(term) >= 3]
+        like_terms = [term for term in terms if len(term) < 3]
+        
+        sql = 'SELECT name, summary, version, repo FROM packages'
+        clauses = []
+        params: List[Any] = []
+        
+        if match_terms:
+            quoted = ' AND '.join('"{}"'.format(term.replace('"', '""')) for term in match_terms)
+            clauses.append('packages MATCH ?')
+            params.append(f'{{name summary}} : ({quoted})')
+        
+        for term in like_terms:
+            clauses.append('(name LIKE ? OR summary LIKE ?)')
+            params.extend([f'%{term}%', f'%{term}%'])
+        
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        if match_terms:
+            sql += ' ORDER BY bm25(packages, 10.0, 3.0)'
+        sql += ' LIMIT ?'
+        params.append(limit)
+        
+        conn = sqlite3.connect(self.path)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        
+        packages = []
+        seen = set()
+        for name, summary, version, repo in rows:
+            if name.lower() in seen:
+                continue
+            seen.add(name.lower())
+            packages.append({
+                'name': name,
+                'display_name': name,
+                'summary': summary or None,
+                'version': version or None,
+                'repository': repo or None,
+                'installed': False
+            })
+        return packages
+
+
+package_index = PackageIndex()
@@ -0,0 +1,24 @@
+from typing import List, Dict, Any
+
+
+def _match_tier(pkg: Dict[str, Any], query: str, terms: List[str]) -> int:
+    name = pkg['name'].lower()
+    if name == query:
+        return 0
+    if name.startswith(query):
+        return 1
+    if query in name or all(term in name for term in terms):
+        return 2
+    summary = (pkg.get('summary') or '').lower()
+    if query in summary or all(term in name or term in summary for term in terms):
+        return 3
+    return 4
+
+
+def rank_packages(packages: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    query = query.strip().lower()
+    terms = query.split()
+    return sorted(
+        packages,
+        key=lambda pkg: (_match_tier(pkg, query, terms), len(pkg['name']), pkg['name'].lower())
+    )
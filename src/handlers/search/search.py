@@ -1,56 +1,74 @@
 import subprocess
-from typing import List, Dict, Any
+from time import monotonic
+from typing import Callable, List, Dict, Any, Optional, Set
 
 from src.handlers.common import (
     is_metadata_line,
     parse_package_line,
-    create_package_dict
+    create_package_dict,
+    stream_command,
+    get_dnf_env
 )
+from src.handlers.metadata import cache_only, needs_metadata
+from src.utils import Cancellable, CancelledError
+from src.handlers.search.index import package_index
+from src.handlers.installed import annotate_installed
+from src.core.config import STREAM_BATCH_SIZE, STREAM_BATCH_INTERVAL
 from src.core.logger import logger
 
 
-def search_packages(query: str) -> List[Dict[str, Any]]:
+def search_packages(query: str, cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
+    return stream_search_packages(query, None, cancellable)
+
+
+def stream_search_packages(query: str, on_batch: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                           cancellable: Optional[Cancellable] = None) -> List[Dict[str, Any]]:
     logger.debug(f"Searching packages with query: {query}")
     
+    packages = search_index(query)
+    if packages is not None:
+        return packages
+    
+    packages = []
+    seen: Set[str] = set()
+    batch: List[Dict[str, Any]] = []
+    last_flush = monotonic()
+    
+    def flush() -> None:
+        nonlocal batch, last_flush
+        if batch:
+            annotate_installed(batch)
+            if on_batch:
+                on_batch(batch)
+            batch = []
+        last_flush = monotonic()
+    
+    def on_line(line: str) -> None:
+        pkg = parse_search_line(line, seen)
+        if pkg:
+            packages.append(pkg)
+            batch.append(pkg)
+        if len(batch) >= STREAM_BATCH_SIZE or (batch and monotonic() - last_flush >= STREAM_BATCH_INTERVAL):
+            flush()
+    
     try:
-        result = subprocess.run(
-            ['dnf', 'search', '--quiet', query],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
-        
-        packages = []
-        seen = set()
-        
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            if is_metadata_line(line):
-                continue
-            
-            if ':' in line:
-                name, summary = parse_package_line(line)
-                if not name or name.lower() in seen:
-                    continue
-                seen.add(name.lower())
-                pkg = create_package_dict(name, summary)
-                if pkg:
-                    packages.append(pkg)
-            else:
-                if line.lower() in seen:
-                    continue
-                seen.add(line.lower())
-                pkg = create_package_dict(line, None)
-                if pkg:
-                    packages.append(pkg)
+        args = ['dnf', 'search', '--quiet', query]
+        cached_args = cache_only(args)
+        errors: List[str] = []
+        returncode = _stream_search(cached_args, on_line, errors.append, cancellable)
+        if cached_args is not args and not packages and needs_metadata(returncode, '\n'.join(errors)):
+            logger.debug("Cached metadata not usable for search, retrying with a metadata refresh")
+            returncode = _stream_search(args, on_line, None, cancellable)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, args)
         
+        flush()
         logger.info(f"Found {len(packages)} packages for query: {query}")
         return packages
         
+    except CancelledError:
+        logger.debug(f"DNF search cancelled for query: {query}")
+        raise
     except subprocess.TimeoutExpired:
         logger.error(f"DNF search timed out for query: {query}")
         raise Exception('DNF search timed out')
@@ -60,3 +78,46 @@ def search_packages(query: str) -> List[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Unexpected error during package search: {e}")
         raise Exception(f'Failed to search packages: {str(e)}')
+
+
+def _stream_search(args: List[str], on_line: Callable[[str], None],
+                   on_error_line: Optional[Callable[[str], None]], cancellable: Optional[Cancellable]) -> int:
+    return stream_command(
+        args,
+        on_line,
+        timeout=30,
+        cancellable=cancellable,
+        env=get_dnf_env(),
+        stderr=subprocess.DEVNULL,
+        on_error_line=on_error_line
+    )
+
+
+def search_index(query: str) -> Optional[List[Dict[str, Any]]]:
+    package_index.ensure_fresh()
+    if not package_index.is_ready():
+        return None
+    
+    try:
+        packages = annotate_installed(package_index.search(query))
+        logger.info(f"Found {len(packages)} packages in index for query: {query}")
+        return packages
+    except Exception as e:
+        logger.warning(f"Package index search failed, falling back to DNF: {e}")
+        return None
+
+
+def parse_search_line(line: str, seen: Set[str]) -> Optional[Dict[str, Any]]:
+    line = line.strip()
+    if not line or is_metadata_line(line):
+        return None
+    
+    if ':' in line:
+        name, summary = parse_package_line(line)
+    else:
+        name, summary = line, None
+    
+    if not name or name.lower() in seen:
+        return None
+    seen.add(name.lower())
+    return create_package_dict(name, summary)
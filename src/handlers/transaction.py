@@ -0,0 +1,150 @@
+import re
+from collections import deque
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from src.handlers.common import stream_command, get_polkit_env, format_size
+from src.utils import Cancellable
+from src.core.logger import logger
+
+
+ProgressCallback = Optional[Callable[[Dict[str, Any]], None]]
+
+TRANSACTION_ERROR_LINES = 5
+DOWNLOAD_SHARE = 0.5
+VERIFY_SHARE = 0.05
+
+SIZE_UNITS = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3, 't': 1024 ** 4}
+
+TRANSACTION_ACTIONS = (
+    'Installing', 'Upgrading', 'Reinstalling', 'Downgrading', 'Erasing',
+    'Removing', 'Cleanup', 'Obsoleting', 'Replacing'
+)
+
+DNF4_DOWNLOAD = re.compile(r'^\((\d+)/(\d+)\):\s+(\S+).*\|\s*([\d.]+)\s*([kKMGT]?)i?B\s')
+DNF4_STEP = re.compile(r'^\s*([A-Z][a-z]+)\s*:\s*(\S+)\s+(\d+)/(\d+)\s*$')
+DNF5_LINE = re.compile(r'^\[\s*(\d+)/(\d+)\]\s+(.+?)\s+\d+%\s*\|(.*)$')
+DNF5_SIZE = re.compile(r'\|\s*([\d.]+)\s*([kKMGT]?)i?B\s*\|')
+
+
+def _to_bytes(value: str, unit: str) -> int:
+    return int(float(value) * SIZE_UNITS.get(unit.lower(), 1))
+
+
+class TransactionProgress:
+    def __init__(self) -> None:
+        self.phase = 'preparing'
+        self.package: Optional[str] = None
+        self.downloaded = 0
+        self.download_fraction = 0.0
+        self.step_fraction = 0.0
+        self.had_download = False
+        self.reported = 0.0
+    
+    def feed(self, line: str) -> bool:
+        match = DNF4_DOWNLOAD.match(line)
+        if match:
+            done, total, package, value, unit = match.groups()
+            self._on_download(int(done), int(total), package, _to_bytes(value, unit))
+            return True
+        
+        match = DNF4_STEP.match(line)
+        if match:
+            action, package, done, total = match.groups()
+            return self._on_step(action, package, int(done), int(total))
+        
+        match = DNF5_LINE.match(line)
+        if match:
+            done, total, label, rest = match.groups()
+            words = label.split(None, 1)
+            if words[0] == 'Total':
+                return False
+            if words[0] in ('Verify', 'Prepare'):
+                return self._on_step('Preparing', None, int(done), int(total))
+            if words[0] in TRANSACTION_ACTIONS:
+                package = words[1] if len(words) > 1 else None
+                return self._on_step(words[0], package, int(done), int(total))
+            size = DNF5_SIZE.search('|' + rest)
+            downloaded = _to_bytes(*size.groups()) if size else 0
+            self._on_download(int(done), int(total), label, downloaded)
+            return True
+        
+        return False
+    
+    def _on_download(self, done: int, total: int, package: str, size: int) -> None:
+        self.phase = 'downloading'
+        self.had_download = True
+        self.package = package
+        self.downloaded += size
+        self.download_fraction = done / total if total else 0.0
+    
+    def _on_step(self, action: str, package: Optional[str], done: int, total: int) -> bool:
+        fraction = done / total if total else 0.0
+        if action == 'Verifying':
+            self.phase = 'verifying'
+        elif action in TRANSACTION_ACTIONS or action == 'Preparing':
+            self.phase = action.lower()
+        else:
+            return False
+        self.package = package
+        self.step_fraction = fraction
+        return True
+    
+    @property
+    def fraction(self) -> float:
+        transaction_start = DOWNLOAD_SHARE if self.had_download else 0.0
+        transaction_share = 1.0 - transaction_start - VERIFY_SHARE
+        
+        if self.phase == 'downloading':
+            return self.download_fraction * DOWNLOAD_SHARE
+        if self.phase == 'verifying':
+            return 1.0 - VERIFY_SHARE + self.step_fraction * VERIFY_SHARE
+        return transaction_start + self.step_fraction * transaction_share
+    
+    def snapshot(self) -> Dict[str, Any]:
+        self.reported = min(1.0, max(self.reported, self.fraction))
+        return {
+            'phase': self.phase,
+            'fraction': self.reported,
+            'package': self.package,
+            'downloaded': self.downloaded
+        }
+
+
+def format_progress(progress: Dict[str, Any]) -> str:
+    phase = progress['phase'].capitalize()
+    parts = [f"{phase} {progress['package']}" if progress.get('package') else phase]
+    if progress.get('downloaded'):
+        parts.append(f"{format_size(progress['downloaded'])}B downloaded")
+    return ' · '.join(parts)
+
+
+def run_transaction(args: List[str], on_progress: ProgressCallback = None, timeout: Optional[float] = None,
+                    cancellable: Optional[Cancellable] = None) -> Tuple[bool, str]:
+    progress = TransactionProgress()
+    errors: deque = deque(maxlen=TRANSACTION_ERROR_LINES)
+    last_line = ''
+    
+    def on_line(line: str) -> None:
+        nonlocal last_line
+        if line.strip():
+            last_line = line.strip()
+        if progress.feed(line) and on_progress:
+            on_progress(progress.snapshot())
+    
+    def on_error_line(line: str) -> None:
+        if line.strip():
+            errors.append(line.strip())
+    
+    args = ['pkexec', *args]
+    logger.debug(f"Running transaction: {' '.join(args)}")
+    returncode = stream_command(
+        args,
+        on_line,
+        timeout=timeout,
+        cancellable=cancellable,
+        env=get_polkit_env(),
+        on_error_line=on_error_line
+    )
+    if returncode == 0:
+        return True, ''
+    return False, '\n'.join(errors) or last_line
@@ -1,108 +1,130 @@
 import subprocess
 from typing import List, Dict, Any, Tuple, Optional
 
-from src.handlers.common import extract_base_name, get_polkit_env
-from src.utils import clean_package_name
+from src.handlers.common import extract_base_name, run_command, run_dnf
+from src.handlers import rpmdb
+from src.handlers.transaction import run_transaction, ProgressCallback
+from src.utils import clean_package_name, CancelledError
 from src.core.logger import logger
 
 
+RPM_QUERY_CHUNK = 500
+CHECK_UPDATE_QUERY = ['dnf', 'check-update', '--quiet']
+DETAILS_QUERY = ['rpm', '-q', '--queryformat', '%{NAME}\t%{VERSION}-%{RELEASE}\t%{SUMMARY}\n']
+
+
 def check_updates() -> List[Dict[str, Any]]:
     logger.debug("Checking for available updates")
     
     try:
-        result = subprocess.run(
-            ['dnf', 'check-update', '--quiet'],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=60
-        )
+        result = run_dnf(CHECK_UPDATE_QUERY, timeout=60)
         
         if result.returncode == 0 and not result.stdout.strip():
             logger.info("No updates available")
             return []
         
-        updates = []
-        seen = set()
-        
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if not line or line.startswith('Last metadata'):
-                continue
-            
-            parts = line.split()
-            if len(parts) < 2:
-                continue
-            
-            name = extract_base_name(parts[0])
-            if name.lower() in seen:
-                continue
-            seen.add(name.lower())
-            
-            available_version = parts[1] if len(parts) > 1 else None
-            current_version, summary = _get_package_details(name)
-            display_name = clean_package_name(name)
-            
-            updates.append({
-                'name': name,
-                'display_name': display_name,
-                'current_version': current_version,
-                'available_version': available_version,
-                'summary': summary
-            })
+        available = parse_check_update(result.stdout)
+        details = _get_packages_details([name for name, _ in available])
+        updates = build_updates(available, details)
         
         logger.info(f"Found {len(updates)} available updates")
-        return sorted(updates, key=lambda x: x['name'].lower())
+        return updates
         
     except subprocess.TimeoutExpired:
         logger.error("Update check timed out")
         raise Exception('Update check timed out')
+    except CancelledError:
+        raise
     except Exception as e:
         logger.error(f"Failed to check updates: {e}")
         raise Exception(f'Failed to check updates: {str(e)}')
 
 
-def _get_package_details(package_name: str) -> Tuple[Optional[str], Optional[str]]:
-    try:
-        rpm_result = subprocess.run(
-            ['rpm', '-q', '--queryformat', '%{VERSION}-%{RELEASE}\t%{SUMMARY}', package_name],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+def parse_check_update(output: str) -> List[Tuple[str, str]]:
+    available = []
+    seen = set()
+    
+    for line in output.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('Last metadata'):
+            continue
         
-        if rpm_result.returncode == 0:
-            parts = rpm_result.stdout.split('\t', 1)
-            current_version = parts[0] if len(parts) > 0 else None
-            summary = parts[1] if len(parts) > 1 else None
-            return current_version, summary
-    except Exception:
-        pass
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        
+        name = extract_base_name(parts[0])
+        if name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        available.append((name, parts[1]))
     
-    return None, None
+    return available
+
 
+def build_updates(available: List[Tuple[str, str]],
+                  details: Dict[str, Tuple[Optional[str], Optional[str]]]) -> List[Dict[str, Any]]:
+    updates = []
+    for name, available_version in available:
+        current_version, summary = details.get(name, (None, None))
+        updates.append({
+            'name': name,
+            'display_name': clean_package_name(name),
+            'current_version': current_version,
+            'available_version': available_version,
+            'summary': summary
+        })
+    return sorted(updates, key=lambda x: x['name'].lower())
 
-def update_system() -> Tuple[bool, str]:
+
+def _get_packages_details(package_names: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    details: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    
+    if rpmdb.is_available():
+        try:
+            for header in rpmdb.query(package_names):
+                if header['name'] not in details:
+                    details[header['name']] = (f"{header['version']}-{header['release']}", header['summary'])
+            return details
+        except Exception as e:
+            logger.debug(f"Could not read installed details from the rpm database: {e}")
+            details.clear()
+    
+    for start in range(0, len(package_names), RPM_QUERY_CHUNK):
+        chunk = package_names[start:start + RPM_QUERY_CHUNK]
+        try:
+            rpm_result = run_command([*DETAILS_QUERY, *chunk], timeout=30)
+        except CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Could not query installed details: {e}")
+            continue
+        
+        parse_details(rpm_result.stdout, details)
+    
+    return details
+
+
+def parse_details(output: str, details: Dict[str, Tuple[Optional[str], Optional[str]]]) -> None:
+    for line in output.split('\n'):
+        parts = line.split('\t', 2)
+        if len(parts) < 2 or parts[0] in details:
+            continue
+        details[parts[0]] = (parts[1], parts[2] if len(parts) > 2 else None)
+
+
+def update_system(on_progress: ProgressCallback = None) -> Tuple[bool, str]:
     logger.info("Updating system packages")
     
     try:
-        env = get_polkit_env()
-        
-        result = subprocess.run(
-            ['pkexec', 'dnf', 'upgrade', '-y'],
-            capture_output=True,
-            text=True,
-            timeout=600,
-            env=env
-        )
+        success, output = run_transaction(['dnf', 'upgrade', '-y'], on_progress, timeout=600)
         
-        if result.returncode == 0:
+        if success:
             logger.info("System update completed successfully")
-            return True, result.stdout
+            return True, output
         else:
-            error_msg = result.stderr if result.stderr else result.stdout
-            logger.error(f"System update failed: {error_msg}")
-            return False, error_msg or 'System update failed'
+            logger.error(f"System update failed: {output}")
+            return False, output or 'System update failed'
             
     except subprocess.TimeoutExpired:
         logger.error("System update timed out")
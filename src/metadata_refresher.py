@@ -0,0 +1,129 @@
+import subprocess
+
+from gi.repository import Gio, GLib
+
+from src.handlers.common import run_command
+from src.handlers.metadata import get_metadata_age, refreshed_cache_pattern
+from src.scheduler import PRIORITY_IDLE
+from src.utils import run_in_thread, CancelledError
+from src.core.config import (
+    METADATA_REFRESH_INTERVAL,
+    METADATA_REFRESH_CHECK_INTERVAL,
+    METADATA_REFRESH_INITIAL_DELAY
+)
+from src.core.logger import logger
+
+
+MAKECACHE_TIMEOUT = 600
+
+
+class MetadataRefresher:
+    def __init__(self):
+        self.listeners = []
+        self.running = False
+        self.timer = None
+        self.last_error = None
+    
+    def connect(self, callback):
+        self.listeners.append(callback)
+    
+    def disconnect(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+    
+    def start(self):
+        if self.timer is not None:
+            return
+        
+        def first_check():
+            self.timer = GLib.timeout_add_seconds(METADATA_REFRESH_CHECK_INTERVAL, self._on_tick)
+            self._on_tick()
+            return False
+        
+        self.timer = GLib.timeout_add_seconds(METADATA_REFRESH_INITIAL_DELAY, first_check)
+    
+    def stop(self):
+        if self.timer is not None:
+            GLib.source_remove(self.timer)
+            self.timer = None
+    
+    def get_age(self):
+        return get_metadata_age(refreshed_cache_pattern())
+    
+    def is_due(self):
+        age = self.get_age()
+        return age is None or age >= METADATA_REFRESH_INTERVAL
+    
+    def skip_reason(self):
+        try:
+            if Gio.PowerProfileMonitor.dup_default().get_power_saver_enabled():
+                return 'power saver is enabled'
+        except (AttributeError, GLib.Error):
+            pass
+        
+        network = Gio.NetworkMonitor.get_default()
+        if not network.get_network_available():
+            return 'the network is unavailable'
+        if network.get_network_metered():
+            return 'the network is metered'
+        return None
+    
+    def _on_tick(self):
+        if self.running or not self.is_due():
+            return True
+        
+        reason = self.skip_reason()
+        if reason:
+            logger.debug(f"Skipping metadata refresh: {reason}")
+            return True
+        
+        self.refresh()
+        return True
+    
+    def refresh(self):
+        if self.running:
+            return False
+        
+        self.running = True
+        logger.info("Refreshing package metadata in the background")
+        run_in_thread(
+            self._makecache,
+            callback=self._on_refreshed,
+            error_callback=self._on_failed,
+            priority=PRIORITY_IDLE
+        )
+        self._notify()
+        return True
+    
+    def _makecache(self):
+        try:
+            result = run_command(['dnf', 'makecache', '--quiet'], timeout=MAKECACHE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            raise Exception('Metadata refresh timed out')
+        except CancelledError:
+            raise
+        if result.returncode != 0:
+            raise Exception(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f'exit code {result.returncode}')
+        return result
+    
+    def _on_refreshed(self, result):
+        self.running = False
+        self.last_error = None
+        logger.info("Package metadata refreshed")
+        self._notify()
+    
+    def _on_failed(self, error_msg):
+        self.running = False
+        self.last_error = error_msg
+        logger.warning(f"Metadata refresh failed: {error_msg}")
+        self._notify()
+    
+    def _notify(self):
+        for callback in list(self.listeners):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Metadata refresh listener failed: {e}")
+
+
+metadata_refresher = MetadataRefresher()
@@ -0,0 +1,84 @@
+import os
+
+from gi.repository import Gio, GLib
+
+from src.handlers.metadata import REPOS_DIR, RPMDB_FILES, get_repos_stamp, get_rpmdb_stamp
+from src.core.logger import logger
+
+
+SETTLE_DELAY_MS = 750
+
+
+class PackageState:
+    def __init__(self):
+        self.stamps = {'rpmdb': get_rpmdb_stamp(), 'repos': get_repos_stamp()}
+        self.listeners = []
+        self.monitors = []
+        self.settle_timeout = None
+    
+    @property
+    def generation(self):
+        return f"{self.stamps['rpmdb']}:{self.stamps['repos']}"
+    
+    def connect(self, callback):
+        self.listeners.append(callback)
+    
+    def disconnect(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+    
+    def start_monitoring(self):
+        if self.monitors:
+            return
+        
+        directories = {os.path.dirname(path) for path in RPMDB_FILES}
+        directories.add(REPOS_DIR)
+        
+        for directory in sorted(directories):
+            if not os.path.isdir(directory):
+                continue
+            try:
+                monitor = Gio.File.new_for_path(directory).monitor_directory(Gio.FileMonitorFlags.NONE, None)
+            except GLib.Error as e:
+                logger.warning(f"Cannot watch {directory}: {e.message}")
+                continue
+            monitor.connect('changed', self._on_changed)
+            self.monitors.append(monitor)
+        
+        logger.debug(f"Watching {len(self.monitors)} directories for package state changes")
+    
+    def stop_monitoring(self):
+        for monitor in self.monitors:
+            monitor.cancel()
+        self.monitors = []
+        if self.settle_timeout:
+            GLib.source_remove(self.settle_timeout)
+            self.settle_timeout = None
+    
+    def _on_changed(self, monitor, file, other_file, event_type):
+        if self.settle_timeout:
+            GLib.source_remove(self.settle_timeout)
+        self.settle_timeout = GLib.timeout_add(SETTLE_DELAY_MS, self._on_settled)
+    
+    def _on_settled(self):
+        self.settle_timeout = None
+        self.check()
+        return False
+    
+    def check(self):
+        stamps = {'rpmdb': get_rpmdb_stamp(), 'repos': get_repos_stamp()}
+        changes = {part for part, stamp in stamps.items() if stamp != self.stamps[part]}
+        if not changes:
+            return False
+        
+        self.stamps = stamps
+        logger.info(f"Package state changed: {', '.join(sorted(changes))}")
+        for callback in list(self.listeners):
+            try:
+                callback(changes)
+            except Exception as e:
+                logger.error(f"Package state listener failed: {e}")
+        return True
+
+
+package_state = PackageState()
@@ -0,0 +1,251 @@
+import gi
+gi.require_version('Gtk', '4.0')
+gi.require_version('Adw', '1')
+from gi.repository import Gtk, GLib, Adw
+from typing import Any, Dict, Optional
+
+from src.handlers.dnf_handler import apply_transaction
+from src.handlers.transaction import format_progress
+from src.handlers.notifications import show_success_notification, show_error_notification
+from src.basket import basket, ACTION_INSTALL
+from src.utils import run_in_own_thread, clean_package_name
+from src.package_state import package_state
+from src.core.config import (
+    CONTENT_MARGIN, CONTENT_SPACING,
+    ICON_PACKAGE,
+    CSS_DIM_LABEL, CSS_TITLE_3
+)
+from src.core.logger import logger
+
+
+class BasketPage:
+    def __init__(self, main_window: Any) -> None:
+        self.main_window = main_window
+        self.progress_timeout: Optional[int] = None
+        self.applying = False
+        self.applied = []
+        self.page = self._build_page()
+        self._refresh()
+        basket.connect(self._refresh)
+    
+    def _build_page(self) -> Adw.ToastOverlay:
+        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=CONTENT_SPACING)
+        content_box.set_margin_start(CONTENT_MARGIN)
+        content_box.set_margin_end(CONTENT_MARGIN)
+        content_box.set_margin_top(32)
+        content_box.set_margin_bottom(32)
+        main_box.append(content_box)
+        
+        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=16)
+        header_box.set_margin_bottom(20)
+        content_box.append(header_box)
+        
+        title_label = Gtk.Label(label='Basket')
+        title_label.set_css_classes([CSS_TITLE_3])
+        title_label.set_xalign(0)
+        title_label.set_hexpand(True)
+        header_box.append(title_label)
+        
+        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        header_box.append(button_box)
+        
+        self.clear_btn = Gtk.Button(label='Clear')
+        self.clear_btn.connect('clicked', lambda button: basket.clear())
+        button_box.append(self.clear_btn)
+        
+        self.apply_btn = Gtk.Button(label='Apply Changes')
+        self.apply_btn.set_css_classes(['suggested-action'])
+        self.apply_btn.connect('clicked', self._on_apply)
+        button_box.append(self.apply_btn)
+        
+        self.status_label = Gtk.Label()
+        self.status_label.add_css_class(CSS_DIM_LABEL)
+        self.status_label.set_xalign(0)
+        self.status_label.set_margin_bottom(16)
+        content_box.append(self.status_label)
+        
+        self.progress_bar = Gtk.ProgressBar()
+        self.progress_bar.set_visible(False)
+        self.progress_bar.set_margin_bottom(16)
+        content_box.append(self.progress_bar)
+        
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_vexpand(True)
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        content_box.append(scrolled)
+        
+        self.items_list = Gtk.ListBox()
+        self.items_list.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.items_list.add_css_class('boxed-list')
+        self.items_list.connect('row-activated', self._on_row_activated)
+        scrolled.set_child(self.items_list)
+        
+        self.empty_state = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
+        self.empty_state.set_halign(Gtk.Align.CENTER)
+        self.empty_state.set_margin_top(80)
+        content_box.append(self.empty_state)
+        
+        empty_icon = Gtk.Image.new_from_icon_name('list-add-symbolic')
+        empty_icon.set_pixel_size(40)
+        empty_icon.add_css_class(CSS_DIM_LABEL)
+        self.empty_state.append(empty_icon)
+        
+        empty_label = Gtk.Label(label='Queue installs and removals from Search, Installed or a package page')
+        empty_label.add_css_class(CSS_DIM_LABEL)
+        empty_label.set_wrap(True)
+        self.empty_state.append(empty_label)
+        
+        self.toast_overlay = Adw.ToastOverlay()
+        self.toast_overlay.set_child(main_box)
+        
+        return self.toast_overlay
+    
+    def _refresh(self) -> None:
+        while self.items_list.get_first_child():
+            self.items_list.remove(self.items_list.get_first_child())
+        
+        for name, action in basket.items.items():
+            self.items_list.append(self._create_item_row(name, action))
+        
+        installs, removals = len(basket.installs), len(basket.removals)
+        parts = []
+        if installs:
+            parts.append(f'{installs} to install')
+        if removals:
+            parts.append(f'{removals} to remove')
+        self.status_label.set_text(', '.join(parts) if parts else 'The basket is empty')
+        
+        self.items_list.set_visible(bool(basket))
+        self.empty_state.set_visible(not basket)
+        self.apply_btn.set_sensitive(bool(basket) and not self.applying)
+        self.clear_btn.set_sensitive(bool(basket) and not self.applying)
+    
+    def _create_item_row(self, name: str, action: str) -> Gtk.ListBoxRow:
+        row = Gtk.ListBoxRow()
+        row._package_name = name
+        
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        box.set_margin_start(16)
+        box.set_margin_end(16)
+        box.set_margin_top(12)
+        box.set_margin_bottom(12)
+        row.set_child(box)
+        
+        icon = Gtk.Image.new_from_icon_name(ICON_PACKAGE)
+        icon.set_pixel_size(24)
+        box.append(icon)
+        
+        name_label = Gtk.Label(label=clean_package_name(name))
+        name_label.set_css_classes(['title-4'])
+        name_label.set_xalign(0)
+        name_label.set_hexpand(True)
+        box.append(name_label)
+        
+        action_label = Gtk.Label(label='Install' if action == ACTION_INSTALL else 'Remove')
+        action_label.add_css_class(CSS_DIM_LABEL)
+        box.append(action_label)
+        
+        remove_btn = Gtk.Button.new_from_icon_name('window-close-symbolic')
+        remove_btn.add_css_class('flat')
+        remove_btn.add_css_class('circular')
+        remove_btn.set_valign(Gtk.Align.CENTER)
+        remove_btn.set_tooltip_text('Remove from basket')
+        remove_btn.set_sensitive(not self.applying)
+        remove_btn.connect('clicked', lambda button: basket.discard(name))
+        box.append(remove_btn)
+        
+        return row
+    
+    def _on_row_activated(self, listbox: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
+        package_name = getattr(row, '_package_name', None)
+        if package_name:
+            self.main_window.show_package_detail(package_name)
+    
+    def _on_apply(self, button: Gtk.Button) -> None:
+        if not basket:
+            return
+        
+        parts = []
+        if basket.installs:
+            parts.append(f'install {len(basket.installs)} package{"s" if len(basket.installs) != 1 else ""}')
+        if basket.removals:
+            parts.append(f'remove {len(basket.removals)} package{"s" if len(basket.removals) != 1 else ""}')
+        
+        dialog = Adw.MessageDialog(
+            heading='Apply Changes',
+            body=f'{" and ".join(parts).capitalize()} in a single transaction? This requires administrator privileges.',
+            transient_for=self.main_window
+        )
+        dialog.add_response('cancel', 'Cancel')
+        dialog.add_response('apply', 'Apply')
+        dialog.set_response_appearance('apply', Adw.ResponseAppearance.SUGGESTED)
+        dialog.connect('response', self._on_apply_response)
+        dialog.present()
+    
+    def _on_apply_response(self, dialog: Adw.MessageDialog, response: str) -> None:
+        if response == 'apply':
+            self._start_transaction()
+        dialog.destroy()
+    
+    def _start_transaction(self) -> None:
+        self.applied = list(basket.items.items())
+        installs, removals = basket.installs, basket.removals
+        logger.info(f"Applying basket: {len(installs)} installs, {len(removals)} removals")
+        
+        self.applying = True
+        self._refresh()
+        self.apply_btn.set_label('Applying...')
+        self.progress_bar.set_visible(True)
+        self.progress_bar.set_show_text(False)
+        self.progress_bar.pulse()
+        
+        def pulse_progress():
+            self.progress_bar.pulse()
+            return True
+        
+        self.progress_timeout = GLib.timeout_add(50, pulse_progress)
+        
+        def on_progress(progress):
+            GLib.idle_add(self._on_progress, progress)
+        
+        run_in_own_thread(
+            lambda: apply_transaction(installs, removals, on_progress),
+            callback=lambda result: self._transaction_complete(result[0], result[1]),
+            error_callback=lambda e: self._transaction_complete(False, str(e))
+        )
+    
+    def _on_progress(self, progress: Dict[str, Any]) -> bool:
+        if self.progress_timeout:
+            GLib.source_remove(self.progress_timeout)
+            self.progress_timeout = None
+        
+        self.progress_bar.set_fraction(progress['fraction'])
+        self.progress_bar.set_show_text(True)
+        self.progress_bar.set_text(format_progress(progress))
+        self.apply_btn.set_label(f"Applying {int(progress['fraction'] * 100)}%")
+        return False
+    
+    def _transaction_complete(self, success: bool, message: str) -> None:
+        if self.progress_timeout:
+            GLib.source_remove(self.progress_timeout)
+            self.progress_timeout = None
+        
+        self.applying = False
+        self.progress_bar.set_visible(False)
+        self.apply_btn.set_label('Apply Changes')
+        
+        if success:
+            logger.info("Basket applied successfully")
+            show_success_notification(self.toast_overlay, 'All changes applied successfully')
+            for name, action in self.applied:
+                if basket.action_for(name) == action:
+                    basket.discard(name)
+            package_state.check()
+        else:
+            logger.error(f"Basket transaction failed: {message}")
+            show_error_notification(
+                self.toast_overlay,
+                f'Transaction failed: {message[:80] if message else "Unknown error"}'
+            )
+        self._refresh()
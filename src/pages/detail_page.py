@@ -1,13 +1,16 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, GLib, Adw
+from gi.repository import Gtk, Gio, GLib, Adw
 
-from src.handlers.dnf_handler import get_package_info, install_package, uninstall_package
-from src.utils import run_in_thread
+from src.handlers.dnf_handler import get_package_info_async, install_package, uninstall_package
+from src.handlers.transaction import format_progress
+from src.utils import run_in_own_thread
+from src.scheduler import scheduler
 from src.handlers.notifications import show_success_notification, show_error_notification
 from src.core.config import ICON_PACKAGE, ICON_ERROR, CSS_TITLE_3, CSS_DIM_LABEL
-from src.cache import cache
+from src.package_state import package_state
+from src.basket import basket, ACTION_INSTALL, ACTION_REMOVE
 
 
 class PackageDetailPage(Gtk.Box):
@@ -18,8 +21,11 @@ class PackageDetailPage(Gtk.Box):
         self.main_window = main_window
         self.package_info = None
         self.progress_timeout = None
+        self.info_cancellable = Gio.Cancellable()
         
         self._build_ui()
+        self.connect('unrealize', self._on_unrealize)
+        basket.connect(self._sync_basket_button)
         self._load_package_info()
     
     def _build_ui(self):
@@ -116,6 +122,14 @@ class PackageDetailPage(Gtk.Box):
         self.uninstall_progress.set_visible(False)
         self.uninstall_progress.set_size_request(100, 4)
         uninstall_box.append(self.uninstall_progress)
+        
+        self.basket_button = Gtk.Button()
+        self.basket_button.set_css_classes(['flat', 'pill'])
+        self.basket_button.set_size_request(100, 34)
+        self.basket_button.set_sensitive(False)
+        self.basket_button.connect('clicked', self._on_basket_clicked)
+        button_box.append(self.basket_button)
+        self._sync_basket_button()
     
     def _build_details(self):
         details_group = Adw.PreferencesGroup()
@@ -162,18 +176,21 @@ class PackageDetailPage(Gtk.Box):
         self.info_container.append(desc_group)
     
     def _load_package_info(self):
-        def do_load():
-            try:
-                return get_package_info(self.package_name)
-            except Exception as e:
-                raise Exception(str(e))
-        
-        run_in_thread(
-            do_load,
-            callback=self._update_info,
-            error_callback=self._show_error
+        self.info_cancellable.cancel()
+        self.info_cancellable = Gio.Cancellable()
+        get_package_info_async(
+            self.package_name,
+            self._update_info,
+            self._show_error,
+            cancellable=self.info_cancellable,
+            owner=self
         )
     
+    def _on_unrealize(self, widget):
+        self.info_cancellable.cancel()
+        scheduler.cancel_owner(self)
+        basket.disconnect(self._sync_basket_button)
+    
     def _update_info(self, info):
         self.package_info = info
         self.spinner.stop()
@@ -190,6 +207,9 @@ class PackageDetailPage(Gtk.Box):
             self.install_button.set_visible(True)
             self.uninstall_button.set_visible(False)
         
+        self.basket_button.set_sensitive(True)
+        self._sync_basket_button()
+        
         version = info.get('version') or 'Unknown'
         release = info.get('release') or ''
         if release and release != 'Unknown':
@@ -209,6 +229,22 @@ class PackageDetailPage(Gtk.Box):
         desc = info.get('description') or 'No description available.'
         self.desc_label.set_text(desc)
     
+    def _basket_action(self):
+        if self.package_info and self.package_info.get('installed', False):
+            return ACTION_REMOVE
+        return ACTION_INSTALL
+    
+    def _sync_basket_button(self):
+        if basket.action_for(self.package_name) == self._basket_action():
+            self.basket_button.set_label('In Basket')
+            self.basket_button.set_tooltip_text('Remove from basket')
+        else:
+            self.basket_button.set_label('Add to Basket')
+            self.basket_button.set_tooltip_text('Queue this change and apply it with others from the Basket tab')
+    
+    def _on_basket_clicked(self, button):
+        basket.toggle(self.package_name, self._basket_action())
+    
     def _show_error(self, error_msg):
         self.spinner.stop()
         self.spinner.set_visible(False)
@@ -261,15 +297,34 @@ class PackageDetailPage(Gtk.Box):
         
         self.progress_timeout = GLib.timeout_add(50, pulse_progress)
         
+        def on_progress(progress):
+            GLib.idle_add(
+                self._on_progress,
+                self.install_progress,
+                self.install_button,
+                'Installing',
+                progress
+            )
+        
         def do_install():
-            return install_package(self.package_name)
+            return install_package(self.package_name, on_progress)
         
-        run_in_thread(
+        run_in_own_thread(
             do_install,
             callback=lambda result: self._install_complete(result[0], result[1]),
             error_callback=lambda e: self._install_complete(False, str(e))
         )
     
+    def _on_progress(self, progress_bar, button, verb, progress):
+        if self.progress_timeout:
+            GLib.source_remove(self.progress_timeout)
+            self.progress_timeout = None
+        
+        progress_bar.set_fraction(progress['fraction'])
+        progress_bar.set_tooltip_text(format_progress(progress))
+        button.set_label(f"{verb} {int(progress['fraction'] * 100)}%")
+        return False
+    
     def _install_complete(self, success, message):
         if self.progress_timeout:
             GLib.source_remove(self.progress_timeout)
@@ -286,12 +341,8 @@ class PackageDetailPage(Gtk.Box):
             )
             self.install_button.set_visible(False)
             self.uninstall_button.set_visible(True)
+            package_state.check()
             self._load_package_info()
-            
-            if hasattr(self.main_window, 'load_installed_packages'):
-                self.main_window.load_installed_packages()
-            
-            cache.clear()
         else:
             show_error_notification(
                 self.toast_overlay,
@@ -330,10 +381,19 @@ class PackageDetailPage(Gtk.Box):
         
         self.progress_timeout = GLib.timeout_add(50, pulse_progress)
         
+        def on_progress(progress):
+            GLib.idle_add(
+                self._on_progress,
+                self.uninstall_progress,
+                self.uninstall_button,
+                'Uninstalling',
+                progress
+            )
+        
         def do_uninstall():
-            return uninstall_package(self.package_name)
+            return uninstall_package(self.package_name, on_progress)
         
-        run_in_thread(
+        run_in_own_thread(
             do_uninstall,
             callback=lambda result: self._uninstall_complete(result[0], result[1]),
             error_callback=lambda e: self._uninstall_complete(False, str(e))
@@ -355,12 +415,8 @@ class PackageDetailPage(Gtk.Box):
             )
             self.uninstall_button.set_visible(False)
             self.install_button.set_visible(True)
+            package_state.check()
             self._load_package_info()
-            
-            if hasattr(self.main_window, 'load_installed_packages'):
-                self.main_window.load_installed_packages()
-            
-            cache.clear()
         else:
             show_error_notification(
                 self.toast_overlay,
@@ -3,8 +3,9 @@ gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, GLib, Adw
 
-from src.handlers.dnf_handler import get_installed_packages
+from src.handlers.dnf_handler import get_installed_packages_async
 from src.utils import run_in_thread, debounce
+from src.scheduler import scheduler
 from src.core.config import (
     CONTENT_MARGIN, CONTENT_SPACING,
     ICON_PACKAGE,
@@ -12,15 +13,22 @@ from src.core.config import (
     SEARCH_DEBOUNCE_MS
 )
 from src.ui.search_card import create_search_card
-from src.widgets.package_row import create_package_row
+from src.widgets.package_list import PackageItem, create_package_list_view, sync_basket_buttons
+from src.basket import basket, ACTION_REMOVE
+from src.trigram_index import TrigramIndex
+from src.core.tracer import tracer
 
 
 class InstalledPage:
     def __init__(self, main_window):
         self.main_window = main_window
         self.all_installed_packages = []
+        self.package_items = []
+        self.filter_index = TrigramIndex([])
+        self.load_task = None
         self.page = self.create_page()
         self.load_installed_packages()
+        basket.connect(self.on_basket_changed)
     
     def create_page(self):
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
@@ -49,10 +57,7 @@ class InstalledPage:
         scrolled.set_vexpand(True)
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         content_box.append(scrolled)
-        self.packages_list = Gtk.ListBox()
-        self.packages_list.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.packages_list.add_css_class('boxed-list')
-        self.packages_list.connect('row-activated', self.on_row_activated)
+        self.packages_list, self.package_store = create_package_list_view(self.on_package_activated, ACTION_REMOVE)
         scrolled.set_child(self.packages_list)
         self.spinner = Gtk.Spinner()
         self.spinner.set_size_request(32, 32)
@@ -76,21 +81,26 @@ class InstalledPage:
         return main_box
     
     def load_installed_packages(self):
-        def do_load():
-            try:
-                return get_installed_packages()
-            except Exception as e:
-                raise Exception(str(e))
-        run_in_thread(
-            do_load,
-            callback=self.update_packages,
-            error_callback=self.show_error
-        )
+        def on_packages(packages):
+            run_in_thread(
+                lambda: (packages, TrigramIndex(packages)),
+                callback=self.update_packages,
+                error_callback=self.show_error,
+                owner=self
+            )
+        scheduler.cancel_owner(self)
+        if self.load_task is not None:
+            self.load_task.cancel()
+        self.load_task = get_installed_packages_async(on_packages, self.show_error, owner=self)
     
-    def update_packages(self, packages):
+    def update_packages(self, result):
+        packages, filter_index = result
+        tracer.first_result('installed', len(packages))
         self.spinner.stop()
         self.spinner.set_visible(False)
         self.all_installed_packages = packages
+        self.filter_index = filter_index
+        self.package_items = [PackageItem(pkg) for pkg in packages]
         self.filter_packages()
     
     @debounce(SEARCH_DEBOUNCE_MS)
@@ -101,27 +111,20 @@ class InstalledPage:
         pass
     
     def filter_packages(self):
-        while self.packages_list.get_first_child():
-            self.packages_list.remove(self.packages_list.get_first_child())
-        query = self.search_entry.get_text().strip().lower()
+        query = self.search_entry.get_text().strip()
         if query:
-            filtered = [pkg for pkg in self.all_installed_packages 
-                       if query in pkg['name'].lower() or 
-                       (pkg.get('summary') and query in pkg['summary'].lower())]
+            filtered = [self.package_items[i] for i in self.filter_index.search(query)]
         else:
-            filtered = self.all_installed_packages
-        if not filtered:
-            self.empty_state.set_visible(True)
-            return
-        self.empty_state.set_visible(False)
-        rows = [create_package_row(pkg) for pkg in filtered]
-        for row in rows:
-            self.packages_list.append(row)
+            filtered = self.package_items
+        self.package_store.splice(0, self.package_store.get_n_items(), filtered)
+        self.packages_list.set_visible(bool(filtered))
+        self.empty_state.set_visible(not filtered)
+    
+    def on_basket_changed(self):
+        sync_basket_buttons(self.packages_list)
     
-    def on_row_activated(self, listbox, row):
-        package_name = getattr(row, '_package_name', None)
-        if package_name:
-            self.main_window.show_package_detail(package_name)
+    def on_package_activated(self, pkg):
+        self.main_window.show_package_detail(pkg['name'])
     
     def show_error(self, error_msg):
         self.spinner.stop()
@@ -1,28 +1,37 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, Gdk
+from gi.repository import Gtk, Adw, Gdk, GLib
 from typing import Optional, Any, Dict, List
 
-from src.handlers.dnf_handler import search_packages
+from src.handlers.dnf_handler import search_index, search_packages_async, suggest_package_names, get_package_info
 from src.utils import run_in_thread
+from src.scheduler import PRIORITY_IDLE
 from src.cache import cache
+from src.prefetch import Prefetcher
 from src.core.config import (
     CONTENT_MARGIN, CONTENT_SPACING,
     CSS_TITLE_2, CSS_DIM_LABEL, ICON_SEARCH,
-    MAX_SEARCH_RESULTS
+    MAX_SEARCH_RESULTS, PREFETCH_COUNT
 )
 from src.ui.search_card import create_search_card
 from src.ui.results_section import create_results_section
 from src.widgets.package_row import create_package_row
+from src.widgets.basket_button import sync_basket_button
+from src.basket import basket
 from src.core.logger import logger
+from src.core.tracer import tracer
 
 
 class SearchPage:
     def __init__(self, main_window: Any) -> None:
         self.main_window = main_window
-        self.search_thread: Optional[Any] = None
+        self.search_task: Optional[Any] = None
+        self.search_generation = 0
+        self.streamed_count = 0
+        self.prefetcher = Prefetcher(get_package_info)
         self.page = self._build_page()
+        basket.connect(self._on_basket_changed)
     
     def _build_page(self) -> Gtk.Box:
         container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
@@ -94,6 +103,11 @@ class SearchPage:
         empty_label.set_margin_top(12)
         self.empty_state.append(empty_label)
         
+        self.suggestion_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        self.suggestion_box.set_halign(Gtk.Align.CENTER)
+        self.suggestion_box.set_visible(False)
+        self.empty_state.append(self.suggestion_box)
+        
         parent.append(self.results_container)
     
     def _on_row_click(self, listbox: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
@@ -113,19 +127,28 @@ class SearchPage:
         if not query:
             return
         
-        if self.search_thread and self.search_thread.is_alive():
-            return
+        self._cancel_search()
         
-        cached = cache.get(query.lower())
+        cached = cache.peek(query.lower())
         if cached is not None:
             self.results_container.set_visible(True)
-            self._display_results(cached, query)
+            self._clear_suggestions()
+            self._display_results(cached, query, self.search_generation)
             return
         
         self._start_search(query)
     
+    def _cancel_search(self) -> None:
+        self.search_generation += 1
+        self.prefetcher.cancel()
+        if self.search_task:
+            logger.debug("Cancelling superseded search")
+            self.search_task.cancel()
+            self.search_task = None
+    
     def _start_search(self, query: str) -> None:
         logger.debug(f"Starting search for: {query}")
+        generation = self.search_generation
         self.results_container.set_visible(True)
         self.status_label.set_text('Searching...')
         self.spinner.set_visible(True)
@@ -133,35 +156,83 @@ class SearchPage:
         self.empty_state.set_visible(False)
         
         self._clear_results()
+        self._clear_suggestions()
+        self.streamed_count = 0
+        
+        key = query.lower()
+        
+        def lookup() -> Optional[List[Dict[str, Any]]]:
+            cached = cache.load(key)
+            if cached is not None:
+                return cached
+            packages = search_index(query)
+            if packages is not None:
+                packages = packages[:MAX_SEARCH_RESULTS]
+                cache.set(key, packages)
+            return packages
+        
+        def on_lookup(packages: Optional[List[Dict[str, Any]]]) -> None:
+            if generation != self.search_generation:
+                return
+            if packages is not None:
+                self._display_results(packages, query, generation)
+                return
+            self.search_task = search_packages_async(
+                query,
+                lambda batch: self._append_results(list(batch), generation),
+                on_results,
+                on_error,
+                owner=self
+            )
+        
+        def on_results(packages: List[Dict[str, Any]]) -> None:
+            packages = packages[:MAX_SEARCH_RESULTS]
+            run_in_thread(lambda: cache.set(key, packages), priority=PRIORITY_IDLE)
+            self._display_results(packages, query, generation)
         
-        def search() -> List[Dict[str, Any]]:
-            try:
-                packages = search_packages(query)
-                if len(packages) > MAX_SEARCH_RESULTS:
-                    packages = packages[:MAX_SEARCH_RESULTS]
-                cache.set(query.lower(), packages)
-                return packages
-            except Exception as e:
-                logger.error(f"Search failed: {e}")
-                raise Exception(str(e))
-        
-        self.search_thread = run_in_thread(
-            search,
-            callback=lambda packages: self._display_results(packages, query),
-            error_callback=self._on_error
-        )
+        def on_error(error_msg: str) -> None:
+            self._on_error(error_msg, generation)
+        
+        self.search_task = run_in_thread(lookup, callback=on_lookup, error_callback=on_error, owner=self)
     
     def _clear_results(self) -> None:
         while self.results_list.get_first_child():
             self.results_list.remove(self.results_list.get_first_child())
     
-    def _display_results(self, packages: List[Dict[str, Any]], query: str) -> None:
+    def _clear_suggestions(self) -> None:
+        while self.suggestion_box.get_first_child():
+            self.suggestion_box.remove(self.suggestion_box.get_first_child())
+        self.suggestion_box.set_visible(False)
+    
+    def _append_results(self, batch: List[Dict[str, Any]], generation: int) -> bool:
+        if generation != self.search_generation:
+            return False
+        
+        for pkg in batch[:MAX_SEARCH_RESULTS - self.streamed_count]:
+            self.results_list.append(create_package_row(pkg))
+        self.streamed_count = min(MAX_SEARCH_RESULTS, self.streamed_count + len(batch))
+        self.status_label.set_text(f'Searching... {self.streamed_count} found so far')
+        return False
+    
+    def _display_results(self, packages: List[Dict[str, Any]], query: str, generation: int) -> None:
+        if generation != self.search_generation:
+            logger.debug(f"Discarding stale results for: {query}")
+            return
+        
+        self.search_task = None
+        tracer.first_result('search', len(packages))
         self.spinner.stop()
         self.spinner.set_visible(False)
+        self._clear_results()
         
         if not packages:
             self.status_label.set_text(f'No packages found for "{query}"')
             self.empty_state.set_visible(True)
+            run_in_thread(
+                lambda: suggest_package_names(query),
+                callback=lambda suggestions: self._show_suggestions(suggestions, query),
+                owner=self
+            )
             return
         
         self.status_label.set_text(f'Found {len(packages)} packages')
@@ -170,8 +241,46 @@ class SearchPage:
         for pkg in packages:
             row = create_package_row(pkg)
             self.results_list.append(row)
+        
+        self.prefetcher.prefetch([pkg['name'] for pkg in packages[:PREFETCH_COUNT]])
+    
+    def _on_basket_changed(self) -> None:
+        row = self.results_list.get_first_child()
+        while row is not None:
+            if hasattr(row, '_basket_button'):
+                sync_basket_button(row._basket_button)
+            row = row.get_next_sibling()
     
-    def _on_error(self, error_msg: str) -> None:
+    def cancel_prefetch(self) -> None:
+        self.prefetcher.cancel()
+    
+    def _show_suggestions(self, suggestions: List[str], query: str) -> None:
+        self._clear_suggestions()
+        if not suggestions or self.search_entry.get_text().strip() != query:
+            return
+        
+        label = Gtk.Label(label='Did you mean:')
+        label.add_css_class(CSS_DIM_LABEL)
+        self.suggestion_box.append(label)
+        
+        for suggestion in suggestions:
+            button = Gtk.Button(label=suggestion)
+            button.add_css_class('flat')
+            button.connect('clicked', self._on_suggestion_clicked, suggestion)
+            self.suggestion_box.append(button)
+        
+        self.suggestion_box.set_visible(True)
+    
+    def _on_suggestion_clicked(self, button: Gtk.Button, suggestion: str) -> None:
+        logger.debug(f"Searching suggested name: {suggestion}")
+        self.search_entry.set_text(suggestion)
+        self._on_search(button)
+    
+    def _on_error(self, error_msg: str, generation: int) -> None:
+        if generation != self.search_generation:
+            return
+        
+        self.search_task = None
         logger.error(f"Search error: {error_msg}")
         self.spinner.stop()
         self.spinner.set_visible(False)
@@ -2,9 +2,12 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, Gio
+from time import time
 
 from src.core.config import CONTENT_MARGIN, CONTENT_SPACING, CSS_TITLE_3, CSS_DIM_LABEL
 from src.preferences import get_pref, set_pref
+from src.metadata_refresher import metadata_refresher
+from src.utils import format_age
 
 
 class SettingsPage:
@@ -78,6 +81,16 @@ class SettingsPage:
         cache_row.add_suffix(cache_switch)
         group.add(cache_row)
         
+        self.metadata_row = Adw.ActionRow()
+        self.metadata_row.set_title('Package Metadata')
+        self.metadata_refresh_btn = Gtk.Button(label='Refresh')
+        self.metadata_refresh_btn.set_valign(Gtk.Align.CENTER)
+        self.metadata_refresh_btn.connect('clicked', self._on_refresh_metadata)
+        self.metadata_row.add_suffix(self.metadata_refresh_btn)
+        group.add(self.metadata_row)
+        self._update_metadata_row()
+        metadata_refresher.connect(self._update_metadata_row)
+        
         clear_cache_row = Adw.ActionRow()
         clear_cache_row.set_title('Clear Cache')
         clear_cache_row.set_subtitle('Clear cached search results')
@@ -131,8 +144,22 @@ class SettingsPage:
     def _on_cache_toggle(self, switch, param):
         enabled = 'true' if switch.get_active() else 'false'
         set_pref('enable_cache', enabled)
-        from src.cache import cache
-        cache.enabled = switch.get_active()
+    
+    def _update_metadata_row(self):
+        age = metadata_refresher.get_age()
+        if metadata_refresher.running:
+            subtitle = 'Refreshing in the background...'
+        elif age is None:
+            subtitle = 'Not downloaded yet'
+        else:
+            subtitle = f'Updated {format_age(time() - age)}'
+            if metadata_refresher.last_error:
+                subtitle += ' · last refresh failed'
+        self.metadata_row.set_subtitle(subtitle)
+        self.metadata_refresh_btn.set_sensitive(not metadata_refresher.running)
+    
+    def _on_refresh_metadata(self, button):
+        metadata_refresher.refresh()
     
     def _on_clear_cache(self, button):
         from src.cache import cache
@@ -2,10 +2,15 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, GLib, Adw
+from time import time
 from typing import List, Dict, Any, Optional
 
-from src.handlers.dnf_handler import check_updates, update_system
-from src.utils import run_in_thread
+from src.handlers.dnf_handler import check_updates_async, update_system
+from src.handlers.transaction import format_progress
+from src.utils import run_in_thread, run_in_own_thread, format_age
+from src.scheduler import scheduler, PRIORITY_IDLE
+from src.package_state import package_state
+from src.updates_snapshot import load_snapshot, save_snapshot, diff_updates
 from src.handlers.notifications import show_success_notification, show_error_notification
 from src.core.config import (
     CONTENT_MARGIN, CONTENT_SPACING,
@@ -13,6 +18,7 @@ from src.core.config import (
     CSS_DIM_LABEL, CSS_TITLE_3
 )
 from src.widgets.package_row import create_package_row
+from src.core.tracer import tracer
 from src.core.logger import logger
 
 
@@ -20,9 +26,17 @@ class UpdatesPage:
     def __init__(self, main_window):
         self.main_window = main_window
         self.all_updates: List[Dict[str, Any]] = []
+        self.update_rows: Dict[str, Gtk.ListBoxRow] = {}
+        self.checked_at: Optional[float] = None
+        self.stale = False
+        self.checking = False
+        self.check_failed = False
         self.progress_timeout: Optional[int] = None
+        self.check_task = None
         self.page = self._build_page()
+        self._show_snapshot()
         self._check_updates()
+        GLib.timeout_add_seconds(60, self._tick_status)
     
     def _build_page(self) -> Adw.ToastOverlay:
         
@@ -111,42 +125,89 @@ class UpdatesPage:
         
         logger.debug("Checking for updates")
         
-        def do_check():
-            try:
-                return check_updates()
-            except Exception as e:
-                raise Exception(str(e))
+        def on_updates(updates):
+            run_in_thread(lambda: save_snapshot(updates), priority=PRIORITY_IDLE)
+            self._on_updates_checked((updates, time()))
         
-        run_in_thread(
-            do_check,
-            callback=self._update_display,
-            error_callback=self._show_error
-        )
+        scheduler.cancel_owner(self)
+        if self.check_task is not None:
+            self.check_task.cancel()
+        self.checking = True
+        self._refresh_status()
+        self.check_task = check_updates_async(on_updates, self._show_error, owner=self)
     
-    def _update_display(self, updates: List[Dict[str, Any]]) -> None:
+    def _show_snapshot(self) -> None:
+        
+        snapshot = load_snapshot()
+        if snapshot is None:
+            return
         
+        logger.debug(f"Showing {len(snapshot['updates'])} updates from the last check")
+        self.checked_at = snapshot.get('checked_at')
+        self.stale = snapshot['stale']
+        self.spinner.stop()
+        self.spinner.set_visible(False)
+        self._apply_updates(snapshot['updates'])
+    
+    def _on_updates_checked(self, result) -> None:
+        
+        updates, checked_at = result
         logger.info(f"Displaying {len(updates)} available updates")
         
+        self.checking = False
+        self.check_failed = False
+        self.checked_at = checked_at
+        self.stale = False
         self.spinner.stop()
         self.spinner.set_visible(False)
-        self.all_updates = updates
+        self._apply_updates(updates)
+    
+    def _apply_updates(self, updates: List[Dict[str, Any]]) -> None:
         
-        while self.updates_list.get_first_child():
-            self.updates_list.remove(self.updates_list.get_first_child())
+        tracer.first_result('updates', len(updates))
+        added, removed, changed = diff_updates(self.all_updates, updates)
+        if added or removed or changed:
+            logger.debug(f"Update list changed: {len(added)} added, {len(removed)} removed, {len(changed)} changed")
         
-        if not updates:
-            self.status_label.set_text('No updates available')
-            self.empty_state.set_visible(True)
-            self.update_all_btn.set_sensitive(False)
+        for name in removed + changed:
+            self.updates_list.remove(self.update_rows.pop(name))
+        
+        for index, update in enumerate(updates):
+            if update['name'] not in self.update_rows:
+                row = self._create_update_row(update)
+                self.update_rows[update['name']] = row
+                self.updates_list.insert(row, index)
+        
+        self.all_updates = updates
+        self.empty_state.set_visible(not updates)
+        self.update_all_btn.set_sensitive(bool(updates))
+        self._refresh_status()
+    
+    def _refresh_status(self) -> None:
+        
+        if self.checked_at is None:
+            self.status_label.set_text('Checking for updates...' if self.checking else '')
             return
         
-        self.empty_state.set_visible(False)
-        self.update_all_btn.set_sensitive(True)
-        self.status_label.set_text(f'{len(updates)} package{"s" if len(updates) != 1 else ""} can be updated')
+        count = len(self.all_updates)
+        if count:
+            text = f'{count} package{"s" if count != 1 else ""} can be updated'
+        else:
+            text = 'No updates available'
+        text += f' · checked {format_age(self.checked_at)}'
+        if self.stale:
+            text += ' · repositories changed since'
+        
+        if self.checking:
+            text += ' · checking again...'
+        elif self.check_failed:
+            text += ' · last check failed'
+        self.status_label.set_text(text)
+    
+    def _tick_status(self) -> bool:
         
-        for update in updates:
-            row = self._create_update_row(update)
-            self.updates_list.append(row)
+        self._refresh_status()
+        return True
     
     def _create_update_row(self, update: Dict[str, Any]) -> Gtk.ListBoxRow:
         
@@ -221,10 +282,10 @@ class UpdatesPage:
     def _on_refresh(self, button: Gtk.Button) -> None:
         
         logger.debug("Refreshing updates")
-        self.spinner.set_visible(True)
-        self.spinner.start()
-        self.empty_state.set_visible(False)
-        self.status_label.set_text('Checking for updates...')
+        if not self.update_rows:
+            self.spinner.set_visible(True)
+            self.spinner.start()
+            self.empty_state.set_visible(False)
         self._check_updates()
     
     def _on_update_system(self, button: Gtk.Button) -> None:
@@ -259,6 +320,7 @@ class UpdatesPage:
         self.update_all_btn.set_sensitive(False)
         self.update_all_btn.set_label('Updating...')
         self.progress_bar.set_visible(True)
+        self.progress_bar.set_show_text(False)
         self.progress_bar.pulse()
         
         def pulse_progress():
@@ -267,15 +329,30 @@ class UpdatesPage:
         
         self.progress_timeout = GLib.timeout_add(50, pulse_progress)
         
+        def on_progress(progress):
+            GLib.idle_add(self._on_update_progress, progress)
+        
         def do_update():
-            return update_system()
+            return update_system(on_progress)
         
-        run_in_thread(
+        run_in_own_thread(
             do_update,
             callback=lambda result: self._update_complete(result[0], result[1]),
             error_callback=lambda e: self._update_complete(False, str(e))
         )
     
+    def _on_update_progress(self, progress: Dict[str, Any]) -> bool:
+        
+        if self.progress_timeout:
+            GLib.source_remove(self.progress_timeout)
+            self.progress_timeout = None
+        
+        self.progress_bar.set_fraction(progress['fraction'])
+        self.progress_bar.set_show_text(True)
+        self.progress_bar.set_text(format_progress(progress))
+        self.update_all_btn.set_label(f"Updating {int(progress['fraction'] * 100)}%")
+        return False
+    
     def _update_complete(self, success: bool, message: str) -> None:
         
         if self.progress_timeout:
@@ -292,9 +369,7 @@ class UpdatesPage:
                 self.toast_overlay,
                 'System updated successfully'
             )
-            self._check_updates()
-            if hasattr(self.main_window, 'load_installed_packages'):
-                self.main_window.load_installed_packages()
+            package_state.check()
         else:
             logger.error(f"System update failed: {message}")
             show_error_notification(
@@ -305,8 +380,19 @@ class UpdatesPage:
     def _show_error(self, error_msg: str) -> None:
         
         logger.error(f"Error checking updates: {error_msg}")
+        self.checking = False
+        self.check_failed = True
         self.spinner.stop()
         self.spinner.set_visible(False)
+        
+        if self.checked_at is not None:
+            self._refresh_status()
+            show_error_notification(
+                self.toast_overlay,
+                f'Could not check for updates: {error_msg[:80]}'
+            )
+            return
+        
         self.empty_state.set_visible(True)
         
         while self.empty_state.get_first_child():
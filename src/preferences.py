@@ -1,65 +1,168 @@
+import atexit
 import os
+import tempfile
+import threading
+from time import monotonic
+
 from gi.repository import GLib
 
+from src.core.config import PREF_FLUSH_DELAY_MS, PREF_RELOAD_INTERVAL
+from src.core.logger import logger
+
 
 PREF_DIR = os.path.join(GLib.get_user_config_dir(), 'fedar')
 PREF_FILE = os.path.join(PREF_DIR, 'preferences.ini')
 
 
-def _ensure_dir():
-    os.makedirs(PREF_DIR, exist_ok=True)
+def _parse(f):
+    prefs = {}
+    for line in f:
+        line = line.strip()
+        if '=' in line and not line.startswith('#'):
+            k, v = line.split('=', 1)
+            prefs[k.strip()] = v.strip()
+    return prefs
 
 
-def get_pref(key, default=None):
-    _ensure_dir()
-    if not os.path.exists(PREF_FILE):
-        return default
+class PreferencesStore:
+    def __init__(self, path=PREF_FILE):
+        self.path = path
+        self.values = {}
+        self.dirty = set()
+        self.listeners = []
+        self.lock = threading.RLock()
+        self.loaded = False
+        self.exists = False
+        self.mtime = None
+        self.checked_at = 0
+        self.flush_source = None
+        atexit.register(self.flush)
     
-    try:
-        with open(PREF_FILE, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if '=' in line and not line.startswith('#'):
-                    k, v = line.split('=', 1)
-                    if k.strip() == key:
-                        return v.strip()
-    except:
-        pass
-    
-    return default
-
-
-def set_pref(key, value):
-    _ensure_dir()
-    prefs = {}
+    def _stat_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
     
-    if os.path.exists(PREF_FILE):
+    def _read(self):
+        mtime = self._stat_mtime()
+        if mtime is None:
+            return {}, None
         try:
-            with open(PREF_FILE, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line and not line.startswith('#'):
-                        k, v = line.split('=', 1)
-                        prefs[k.strip()] = v.strip()
-        except:
-            pass
+            with open(self.path, 'r') as f:
+                return _parse(f), mtime
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Could not read preferences: {e}")
+            return {}, mtime
+    
+    def _ensure_loaded(self):
+        if not self.loaded:
+            self.values, self.mtime = self._read()
+            self.exists = self.mtime is not None
+            self.loaded = True
+            self.checked_at = monotonic()
+            return
+        
+        if monotonic() - self.checked_at < PREF_RELOAD_INTERVAL:
+            return
+        self.checked_at = monotonic()
+        mtime = self._stat_mtime()
+        if mtime is not None and mtime != self.mtime:
+            self._reload()
+    
+    def _reload(self):
+        values, self.mtime = self._read()
+        self.exists = True
+        for key in self.dirty:
+            values[key] = self.values[key]
+        
+        changed = {key: value for key, value in values.items() if self.values.get(key) != value}
+        self.values = values
+        if changed:
+            logger.debug(f"Preferences changed on disk: {', '.join(sorted(changed))}")
+            GLib.idle_add(self._notify, changed)
+    
+    def get(self, key, default=None):
+        with self.lock:
+            self._ensure_loaded()
+            return self.values.get(key, default)
     
-    prefs[key] = str(value)
+    def set(self, key, value):
+        value = str(value)
+        with self.lock:
+            self._ensure_loaded()
+            if self.values.get(key) == value and self.exists:
+                return
+            self.values[key] = value
+            self.dirty.add(key)
+            if self.flush_source is None:
+                self.flush_source = GLib.timeout_add(PREF_FLUSH_DELAY_MS, self._flush_timeout)
+        self._notify({key: value})
     
-    try:
-        with open(PREF_FILE, 'w') as f:
-            for k, v in prefs.items():
-                f.write(f'{k}={v}\n')
-    except:
-        pass
+    def connect(self, listener):
+        self.listeners.append(listener)
+    
+    def disconnect(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    def _notify(self, changed):
+        for listener in list(self.listeners):
+            try:
+                listener(changed)
+            except Exception as e:
+                logger.error(f"Preferences listener failed: {e}")
+        return False
+    
+    def _flush_timeout(self):
+        with self.lock:
+            self.flush_source = None
+        self.flush()
+        return False
+    
+    def flush(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            
+            directory = os.path.dirname(self.path)
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(prefix='.preferences-', dir=directory)
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        for k, v in self.values.items():
+                            f.write(f'{k}={v}\n')
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError as e:
+                logger.error(f"Failed to save preferences: {e}")
+                return
+            
+            self.dirty.clear()
+            self.exists = True
+            self.mtime = self._stat_mtime()
+
+
+preferences = PreferencesStore()
+
+
+def get_pref(key, default=None):
+    return preferences.get(key, default)
+
+
+def set_pref(key, value):
+    preferences.set(key, value)
 
 
 def is_first_run():
-    if not os.path.exists(PREF_FILE):
-        return True
     return get_pref('first_run', 'true') == 'true'
 
 
 def set_first_run_complete():
     set_pref('first_run', 'false')
-
+    preferences.flush()
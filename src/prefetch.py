@@ -0,0 +1,26 @@
+from functools import partial
+
+from src.scheduler import scheduler, PRIORITY_IDLE
+from src.utils import CancelledError
+from src.core.logger import logger
+
+
+class Prefetcher:
+    def __init__(self, fetch):
+        self.fetch = fetch
+    
+    def prefetch(self, keys):
+        self.cancel()
+        for key in keys:
+            scheduler.submit(partial(self._fetch, key), priority=PRIORITY_IDLE, owner=self)
+    
+    def cancel(self):
+        scheduler.cancel_owner(self, include_running=False)
+    
+    def _fetch(self, key):
+        try:
+            self.fetch(key)
+        except CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Prefetch failed for {key}: {e}")
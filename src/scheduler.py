@@ -0,0 +1,162 @@
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+from gi.repository import GLib
+
+from src.utils import Cancellable, CancelledError
+from src.core.config import SCHEDULER_WORKERS, SCHEDULER_IDLE_WORKERS
+from src.core.logger import logger
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+PRIORITY_IDLE = 2
+
+LANES = (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, PRIORITY_IDLE)
+
+_local = threading.local()
+
+
+def current_cancellable():
+    return getattr(_local, 'cancellable', None)
+
+
+def current_priority():
+    return getattr(_local, 'running_priority', None)
+
+
+@contextmanager
+def default_priority(priority):
+    previous = getattr(_local, 'priority', PRIORITY_INTERACTIVE)
+    _local.priority = priority
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+class TaskHandle:
+    def __init__(self, func, callback, error_callback, priority, owner):
+        self.func = func
+        self.callback = callback
+        self.error_callback = error_callback
+        self.priority = priority
+        self.owner = owner
+        self.cancellable = Cancellable()
+        self.started = False
+    
+    @property
+    def cancelled(self):
+        return self.cancellable.is_cancelled
+    
+    def cancel(self):
+        self.cancellable.cancel()
+
+
+class Scheduler:
+    def __init__(self, workers=SCHEDULER_WORKERS, idle_workers=SCHEDULER_IDLE_WORKERS):
+        self.workers = workers
+        self.limits = {
+            PRIORITY_INTERACTIVE: workers,
+            PRIORITY_BACKGROUND: max(1, workers - 1),
+            PRIORITY_IDLE: max(1, min(idle_workers, workers - 1))
+        }
+        self.shared_limit = max(1, workers - 1)
+        self.queues = {lane: deque() for lane in LANES}
+        self.running = {lane: 0 for lane in LANES}
+        self.owners = {}
+        self.condition = threading.Condition()
+        self.threads = []
+    
+    def submit(self, func, callback=None, error_callback=None, priority=None, owner=None):
+        if priority is None:
+            priority = getattr(_local, 'priority', PRIORITY_INTERACTIVE)
+        handle = TaskHandle(func, callback, error_callback, priority, owner)
+        with self.condition:
+            self.queues[priority].append(handle)
+            if owner is not None:
+                self.owners.setdefault(id(owner), set()).add(handle)
+            if len(self.threads) < self.workers:
+                thread = threading.Thread(target=self._worker, name=f'fedar-worker-{len(self.threads)}', daemon=True)
+                self.threads.append(thread)
+                thread.start()
+            self.condition.notify()
+        return handle
+    
+    def cancel_owner(self, owner, include_running=True):
+        with self.condition:
+            handles = list(self.owners.get(id(owner), ()))
+        
+        cancelled = 0
+        for handle in handles:
+            if include_running or not handle.started:
+                handle.cancel()
+                cancelled += 1
+        if cancelled:
+            logger.debug(f"Cancelled {cancelled} tasks for {type(owner).__name__}")
+    
+    def _next_task(self):
+        for lane in LANES:
+            queue = self.queues[lane]
+            while queue and queue[0].cancelled:
+                self._forget(queue.popleft())
+            if not queue or self.running[lane] >= self.limits[lane]:
+                continue
+            if lane != PRIORITY_INTERACTIVE and self._non_interactive_running() >= self.shared_limit:
+                continue
+            return queue.popleft()
+        return None
+    
+    def _non_interactive_running(self):
+        return self.running[PRIORITY_BACKGROUND] + self.running[PRIORITY_IDLE]
+    
+    def _forget(self, handle):
+        if handle.owner is None:
+            return
+        handles = self.owners.get(id(handle.owner))
+        if handles is not None:
+            handles.discard(handle)
+            if not handles:
+                del self.owners[id(handle.owner)]
+    
+    def _worker(self):
+        while True:
+            with self.condition:
+                handle = self._next_task()
+                while handle is None:
+                    self.condition.wait()
+                    handle = self._next_task()
+                handle.started = True
+                self.running[handle.priority] += 1
+            
+            self._run(handle)
+            
+            with self.condition:
+                self.running[handle.priority] -= 1
+                self._forget(handle)
+                self.condition.notify_all()
+    
+    def _run(self, handle):
+        _local.cancellable = handle.cancellable
+        _local.running_priority = handle.priority
+        try:
+            result = handle.func()
+            if handle.callback:
+                GLib.idle_add(self._deliver, handle, handle.callback, result)
+        except CancelledError:
+            logger.debug("Task cancelled")
+        except Exception as e:
+            if handle.error_callback:
+                GLib.idle_add(self._deliver, handle, handle.error_callback, str(e))
+        finally:
+            _local.cancellable = None
+            _local.running_priority = None
+    
+    def _deliver(self, handle, callback, value):
+        if not handle.cancelled:
+            callback(value)
+        return False
+
+
+scheduler = Scheduler()
@@ -4,6 +4,8 @@ gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw
 from typing import Optional
 
+from src.basket import basket
+
 
 class tab_bar:
     def __init__(self, main_window):
@@ -40,6 +42,14 @@ class tab_bar:
         self.installed_button.set_group(self.search_button)
         tab_box.append(self.installed_button)
         
+        self.basket_button = self._create_tab_button(
+            'list-add-symbolic', 'Basket', 'basket'
+        )
+        self.basket_button.set_group(self.search_button)
+        self.basket_label = self.basket_button.get_child().get_last_child()
+        tab_box.append(self.basket_button)
+        basket.connect(self._on_basket_changed)
+        
         self.settings_button = self._create_tab_button(
             'emblem-system-symbolic', 'Settings', 'settings'
         )
@@ -76,8 +86,12 @@ class tab_bar:
             'search': self.search_button,
             'updates': self.updates_button,
             'installed': self.installed_button,
+            'basket': self.basket_button,
             'settings': self.settings_button
         }
         
         for name, button in buttons.items():
             button.set_active(name == tab_name)
+    
+    def _on_basket_changed(self) -> None:
+        self.basket_label.set_label(f'Basket ({len(basket)})' if basket else 'Basket')
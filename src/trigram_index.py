@@ -0,0 +1,53 @@
+from typing import List, Dict, Any, Sequence, Optional
+
+
+GRAM_SIZE = 3
+
+
+class TrigramIndex:
+    def __init__(self, packages: Sequence[Dict[str, Any]], fields: Sequence[str] = ('name', 'summary')):
+        self.haystacks: List[str] = []
+        self.postings: Dict[str, List[int]] = {}
+        self._last_query: Optional[str] = None
+        self._last_result: List[int] = []
+        
+        for doc_id, pkg in enumerate(packages):
+            text = '\n'.join(pkg.get(field) or '' for field in fields).lower()
+            self.haystacks.append(text)
+            grams = set()
+            for size in range(1, GRAM_SIZE + 1):
+                grams.update(text[i:i + size] for i in range(len(text) - size + 1))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(doc_id)
+    
+    def __len__(self) -> int:
+        return len(self.haystacks)
+    
+    def search(self, query: str) -> List[int]:
+        query = query.lower()
+        if not query:
+            return list(range(len(self.haystacks)))
+        
+        if query == self._last_query:
+            return self._last_result
+        
+        candidates = self._candidates(query)
+        haystacks = self.haystacks
+        result = [doc_id for doc_id in candidates if query in haystacks[doc_id]]
+        
+        self._last_query = query
+        self._last_result = result
+        return result
+    
+    def _candidates(self, query: str) -> Sequence[int]:
+        narrowing = self._last_query is not None and self._last_query in query
+        best: Sequence[int] = self._last_result if narrowing else range(len(self.haystacks))
+        
+        size = min(GRAM_SIZE, len(query))
+        for i in range(len(query) - size + 1):
+            posting = self.postings.get(query[i:i + size])
+            if posting is None:
+                return []
+            if len(posting) < len(best):
+                best = posting
+        return best
@@ -0,0 +1,66 @@
+import json
+import os
+from time import time
+
+from gi.repository import GLib
+
+from src.handlers.metadata import get_metadata_stamp, get_rpmdb_stamp
+from src.core.logger import logger
+
+
+SNAPSHOT_FILE = os.path.join(GLib.get_user_cache_dir(), 'fedar', 'updates.json')
+SNAPSHOT_VERSION = 1
+
+
+def load_snapshot(path=SNAPSHOT_FILE):
+    try:
+        with open(path, 'r') as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable updates snapshot: {e}")
+        return None
+    
+    if snapshot.get('version') != SNAPSHOT_VERSION or not isinstance(snapshot.get('updates'), list):
+        return None
+    
+    if snapshot.get('rpmdb_stamp') != get_rpmdb_stamp():
+        logger.debug("Installed packages changed since the last update check, ignoring snapshot")
+        return None
+    snapshot['stale'] = snapshot.get('metadata_stamp') != get_metadata_stamp()
+    return snapshot
+
+
+def save_snapshot(updates, path=SNAPSHOT_FILE):
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'checked_at': time(),
+        'metadata_stamp': get_metadata_stamp(),
+        'rpmdb_stamp': get_rpmdb_stamp(),
+        'updates': updates
+    }
+    
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Could not save updates snapshot: {e}")
+        return None
+    return snapshot
+
+
+def diff_updates(old, new):
+    old_by_name = {update['name']: update for update in old}
+    new_by_name = {update['name']: update for update in new}
+    
+    added = [name for name in new_by_name if name not in old_by_name]
+    removed = [name for name in old_by_name if name not in new_by_name]
+    changed = [
+        name for name, update in new_by_name.items()
+        if name in old_by_name and update != old_by_name[name]
+    ]
+    return added, removed, changed
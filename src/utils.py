@@ -1,18 +1,70 @@
 import threading
 import re
+from time import time
 from gi.repository import GLib
 
 
-def run_in_thread(func, callback=None, error_callback=None):
-    def wrapper():
+class CancelledError(Exception):
+    pass
+
+
+class Cancellable:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._processes = []
+    
+    @property
+    def is_cancelled(self):
+        return self._cancelled
+    
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            processes, self._processes = self._processes, []
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+    
+    def attach_process(self, process):
+        with self._lock:
+            if not self._cancelled:
+                self._processes.append(process)
+                return
+        process.kill()
+    
+    def detach_process(self, process):
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+    
+    def raise_if_cancelled(self):
+        if self._cancelled:
+            raise CancelledError('Operation cancelled')
+
+
+def run_in_thread(func, callback=None, error_callback=None, priority=None, owner=None):
+    from src.scheduler import scheduler
+    return scheduler.submit(func, callback, error_callback, priority=priority, owner=owner)
+
+
+def _deliver(callback, value):
+    callback(value)
+    return False
+
+
+def run_in_own_thread(func, callback=None, error_callback=None, name='fedar-transaction'):
+    def target():
         try:
             result = func()
-            if callback:
-                GLib.idle_add(callback, result)
         except Exception as e:
             if error_callback:
-                GLib.idle_add(error_callback, str(e))
-    thread = threading.Thread(target=wrapper, daemon=True)
+                GLib.idle_add(_deliver, error_callback, str(e))
+            return
+        if callback:
+            GLib.idle_add(_deliver, callback, result)
+    
+    thread = threading.Thread(target=target, name=name, daemon=True)
     thread.start()
     return thread
 
@@ -50,3 +102,14 @@ def clean_package_name(name):
     for pattern in arch_patterns:
         cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
     return cleaned
+
+
+def format_age(checked_at):
+    seconds = max(0, time() - checked_at)
+    if seconds < 60:
+        return 'just now'
+    
+    for unit, size in (('day', 86400), ('hour', 3600), ('minute', 60)):
+        if seconds >= size:
+            count = int(seconds // size)
+            return f'{count} {unit}{"s" if count != 1 else ""} ago'
@@ -1,3 +1,4 @@
 from src.widgets.package_row import create_package_row
+from src.widgets.package_list import PackageItem, create_package_list_view
 
-__all__ = ['create_package_row']
+__all__ = ['create_package_row', 'PackageItem', 'create_package_list_view']
@@ -0,0 +1,42 @@
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk
+
+from src.basket import basket, ACTION_INSTALL, ACTION_REMOVE
+
+
+def package_action(pkg):
+    return ACTION_REMOVE if pkg.get('installed', False) else ACTION_INSTALL
+
+
+def _on_clicked(button):
+    if button._package:
+        name, action = button._package
+        basket.toggle(name, action)
+
+
+def create_basket_button():
+    button = Gtk.Button()
+    button.add_css_class('flat')
+    button.add_css_class('circular')
+    button.set_valign(Gtk.Align.CENTER)
+    button._package = None
+    button.connect('clicked', _on_clicked)
+    return button
+
+
+def bind_basket_button(button, name, action):
+    button._package = (name, action)
+    sync_basket_button(button)
+
+
+def sync_basket_button(button):
+    if not button._package:
+        return
+    name, action = button._package
+    if basket.action_for(name) == action:
+        button.set_icon_name('object-select-symbolic')
+        button.set_tooltip_text('Remove from basket')
+    else:
+        button.set_icon_name('list-add-symbolic')
+        button.set_tooltip_text('Queue install' if action == ACTION_INSTALL else 'Queue removal')
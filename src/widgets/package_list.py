@@ -0,0 +1,110 @@
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, Gio, GObject
+
+from src.core.config import ROW_PADDING, ICON_PACKAGE, ICON_CHEVRON, CSS_TITLE_4, CSS_DIM_LABEL
+from src.widgets.basket_button import create_basket_button, bind_basket_button, sync_basket_button, package_action
+
+
+class PackageItem(GObject.Object):
+    __gtype_name__ = 'FedarPackageItem'
+    
+    def __init__(self, pkg):
+        super().__init__()
+        self.pkg = pkg
+
+
+def _on_setup(factory, list_item):
+    box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+    box.set_margin_start(ROW_PADDING)
+    box.set_margin_end(ROW_PADDING)
+    box.set_margin_top(10)
+    box.set_margin_bottom(10)
+    
+    icon = Gtk.Image.new_from_icon_name(ICON_PACKAGE)
+    icon.set_pixel_size(28)
+    box.append(icon)
+    
+    info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+    info_box.set_hexpand(True)
+    box.append(info_box)
+    
+    name_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+    name_row.set_hexpand(True)
+    info_box.append(name_row)
+    
+    name = Gtk.Label()
+    name.set_css_classes([CSS_TITLE_4])
+    name.set_xalign(0)
+    name.set_hexpand(True)
+    name_row.append(name)
+    
+    badge = Gtk.Label(label='Installed')
+    badge.add_css_class('dim-label')
+    badge.add_css_class('caption')
+    badge.set_margin_start(8)
+    name_row.append(badge)
+    
+    summary = Gtk.Label()
+    summary.add_css_class(CSS_DIM_LABEL)
+    summary.set_xalign(0)
+    summary.set_wrap(True)
+    summary.set_max_width_chars(70)
+    summary.set_lines(1)
+    summary.set_ellipsize(3)
+    info_box.append(summary)
+    
+    basket_button = create_basket_button()
+    box.append(basket_button)
+    
+    chevron = Gtk.Image.new_from_icon_name(ICON_CHEVRON)
+    chevron.add_css_class(CSS_DIM_LABEL)
+    chevron.set_pixel_size(14)
+    box.append(chevron)
+    
+    box._name_label = name
+    box._badge = badge
+    box._summary_label = summary
+    box._basket_button = basket_button
+    list_item.set_child(box)
+
+
+def _on_bind(factory, list_item, basket_action, bound_buttons):
+    pkg = list_item.get_item().pkg
+    box = list_item.get_child()
+    
+    box._name_label.set_label(pkg.get('display_name', pkg['name']))
+    box._badge.set_visible(pkg.get('installed', False))
+    bind_basket_button(box._basket_button, pkg['name'], basket_action or package_action(pkg))
+    bound_buttons.add(box._basket_button)
+    
+    summary = pkg.get('summary')
+    box._summary_label.set_label(summary or '')
+    box._summary_label.set_visible(bool(summary))
+
+
+def _on_unbind(factory, list_item, bound_buttons):
+    bound_buttons.discard(list_item.get_child()._basket_button)
+
+
+def sync_basket_buttons(list_view):
+    for button in list_view._bound_buttons:
+        sync_basket_button(button)
+
+
+def create_package_list_view(on_activate, basket_action=None):
+    store = Gio.ListStore.new(PackageItem)
+    bound_buttons = set()
+    
+    factory = Gtk.SignalListItemFactory()
+    factory.connect('setup', _on_setup)
+    factory.connect('bind', _on_bind, basket_action, bound_buttons)
+    factory.connect('unbind', _on_unbind, bound_buttons)
+    
+    list_view = Gtk.ListView.new(Gtk.NoSelection.new(store), factory)
+    list_view._bound_buttons = bound_buttons
+    list_view.set_single_click_activate(True)
+    list_view.add_css_class('card')
+    list_view.connect('activate', lambda view, position: on_activate(store.get_item(position).pkg))
+    
+    return list_view, store
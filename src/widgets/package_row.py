@@ -3,6 +3,7 @@ gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk
 
 from src.core.config import ROW_PADDING, ICON_PACKAGE, ICON_CHEVRON, CSS_TITLE_4, CSS_DIM_LABEL
+from src.widgets.basket_button import create_basket_button, bind_basket_button, package_action
 
 
 def create_package_row(pkg):
@@ -40,6 +41,8 @@ def create_package_row(pkg):
         badge.add_css_class('dim-label')
         badge.add_css_class('caption')
         badge.set_margin_start(8)
+        if pkg.get('installed_version'):
+            badge.set_tooltip_text(f"Installed version: {pkg['installed_version']}")
         name_row.append(badge)
     
     if pkg.get('summary'):
@@ -52,6 +55,11 @@ def create_package_row(pkg):
         summary.set_ellipsize(3)
         info_box.append(summary)
     
+    basket_button = create_basket_button()
+    bind_basket_button(basket_button, pkg['name'], package_action(pkg))
+    box.append(basket_button)
+    row._basket_button = basket_button
+    
     chevron = Gtk.Image.new_from_icon_name(ICON_CHEVRON)
     chevron.add_css_class(CSS_DIM_LABEL)
     chevron.set_pixel_size(14)
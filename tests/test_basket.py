@@ -0,0 +1,21 @@
+from src.basket import TransactionBasket, ACTION_INSTALL, ACTION_REMOVE
+
+
+def test_dotted_names_are_kept_whole():
+    basket = TransactionBasket()
+    
+    basket.add('python3.12', ACTION_INSTALL)
+    basket.add('python3', ACTION_REMOVE)
+    
+    assert basket.installs == ['python3.12']
+    assert basket.removals == ['python3']
+
+
+def test_arch_suffix_is_stripped():
+    basket = TransactionBasket()
+    
+    basket.add('htop.x86_64', ACTION_INSTALL)
+    
+    assert 'htop' in basket
+    assert basket.action_for('htop.x86_64') == ACTION_INSTALL
+    assert basket.installs == ['htop']
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from src.handlers.install import install
+
+
+@pytest.fixture
+def transactions(monkeypatch):
+    calls = []
+    
+    def fake_run_transaction(args, on_progress=None, timeout=None):
+        script = None
+        if args[:2] == ['dnf', 'shell']:
+            with open(args[-1]) as f:
+                script = f.read()
+        calls.append((args, script))
+        return True, ''
+    
+    monkeypatch.setattr(install, 'run_transaction', fake_run_transaction)
+    return calls
+
+
+def test_install_only_uses_dnf_install(transactions, monkeypatch):
+    monkeypatch.setattr(install, 'is_dnf5', lambda: True)
+    
+    assert install.apply_transaction(['htop', 'vim-enhanced'], []) == (True, '')
+    assert transactions == [(['dnf', 'install', '-y', 'htop', 'vim-enhanced'], None)]
+
+
+def test_remove_only_uses_dnf_remove(transactions, monkeypatch):
+    monkeypatch.setattr(install, 'is_dnf5', lambda: False)
+    
+    assert install.apply_transaction([], ['nano']) == (True, '')
+    assert transactions == [(['dnf', 'remove', '-y', 'nano'], None)]
+
+
+def test_mixed_on_dnf5_uses_dnf_do(transactions, monkeypatch):
+    monkeypatch.setattr(install, 'is_dnf5', lambda: True)
+    
+    install.apply_transaction(['htop'], ['nano'])
+    assert transactions == [
+        (['dnf', 'do', '-y', '--action=install', 'htop', '--action=remove', 'nano'], None)
+    ]
+
+
+def test_mixed_on_dnf4_runs_a_shell_script(transactions, monkeypatch):
+    monkeypatch.setattr(install, 'is_dnf5', lambda: False)
+    
+    install.apply_transaction(['htop', 'git'], ['nano'])
+    
+    (args, script), = transactions
+    assert args[:3] == ['dnf', 'shell', '-y']
+    assert script == 'install htop git\nremove nano\nrun\n'
+    assert not os.path.exists(args[-1])
+
+
+def test_dotted_package_names_reach_dnf_intact(transactions, monkeypatch):
+    monkeypatch.setattr(install, 'is_dnf5', lambda: True)
+    
+    install.apply_transaction(['python3.12', 'htop.x86_64'], [])
+    assert transactions == [(['dnf', 'install', '-y', 'python3.12', 'htop'], None)]
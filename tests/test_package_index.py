@@ -0,0 +1,48 @@
+import pytest
+
+from src.handlers.search import index as index_module
+from src.handlers.search.index import PackageIndex
+
+
+@pytest.fixture
+def stamp(monkeypatch):
+    current = {'value': 'before'}
+    monkeypatch.setattr(index_module, 'get_metadata_stamp', lambda: current['value'])
+    return current
+
+
+@pytest.fixture
+def package_index(tmp_path, stamp):
+    index = PackageIndex(str(tmp_path / 'packages.db'))
+    index._write([('htop', 'Interactive process viewer', '', 'x86_64', '3.3.0-1', 'fedora')], stamp['value'])
+    return index
+
+
+def test_missing_index_is_not_ready(tmp_path, stamp):
+    index = PackageIndex(str(tmp_path / 'packages.db'))
+    
+    assert not index.is_ready()
+    assert index.is_stale()
+    assert not (tmp_path / 'packages.db').exists()
+
+
+def test_stale_index_keeps_serving_results(package_index, stamp, monkeypatch):
+    builds = []
+    monkeypatch.setattr(package_index, 'build_in_background', lambda: builds.append(True))
+    stamp['value'] = 'after'
+    
+    package_index.ensure_fresh()
+    
+    assert builds == [True]
+    assert package_index.is_ready()
+    assert [package['name'] for package in package_index.search('htop')] == ['htop']
+
+
+def test_fresh_index_does_not_rebuild(package_index, monkeypatch):
+    builds = []
+    monkeypatch.setattr(package_index, 'build_in_background', lambda: builds.append(True))
+    
+    package_index.ensure_fresh()
+    
+    assert builds == []
+    assert package_index.is_ready()
@@ -0,0 +1,60 @@
+import threading
+
+from src.scheduler import Scheduler, default_priority, current_priority, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, PRIORITY_IDLE
+
+
+def test_interactive_task_starts_when_background_lanes_are_saturated():
+    scheduler = Scheduler(workers=4, idle_workers=2)
+    release = threading.Event()
+    started = threading.Event()
+    
+    try:
+        for _ in range(3):
+            scheduler.submit(release.wait, priority=PRIORITY_BACKGROUND)
+        for _ in range(2):
+            scheduler.submit(release.wait, priority=PRIORITY_IDLE)
+        
+        scheduler.submit(started.set, priority=PRIORITY_INTERACTIVE)
+        
+        assert started.wait(1)
+        with scheduler.condition:
+            assert scheduler.running[PRIORITY_BACKGROUND] + scheduler.running[PRIORITY_IDLE] <= 3
+    finally:
+        release.set()
+
+
+def test_default_priority_applies_to_tasks_submitted_inside_the_block():
+    scheduler = Scheduler(workers=2, idle_workers=1)
+    release = threading.Event()
+    
+    try:
+        with default_priority(PRIORITY_BACKGROUND):
+            background = scheduler.submit(release.wait)
+        interactive = scheduler.submit(release.wait)
+        
+        assert background.priority == PRIORITY_BACKGROUND
+        assert interactive.priority == PRIORITY_INTERACTIVE
+    finally:
+        release.set()
+
+
+def test_idle_tasks_run_their_commands_at_low_priority(monkeypatch):
+    from src.handlers import common
+    
+    monkeypatch.setattr(common.shutil, 'which', lambda name: f'/usr/bin/{name}')
+    scheduler = Scheduler(workers=2, idle_workers=1)
+    seen = {}
+    done = threading.Event()
+    
+    def record(lane):
+        seen[lane] = (current_priority(), common._for_current_task(['dnf', 'info', 'htop']))
+        if len(seen) == 2:
+            done.set()
+    
+    scheduler.submit(lambda: record('idle'), priority=PRIORITY_IDLE)
+    scheduler.submit(lambda: record('interactive'), priority=PRIORITY_INTERACTIVE)
+    
+    assert done.wait(1)
+    assert seen['idle'] == (PRIORITY_IDLE, ['nice', '-n', '19', 'ionice', '-c', '3', 'dnf', 'info', 'htop'])
+    assert seen['interactive'] == (PRIORITY_INTERACTIVE, ['dnf', 'info', 'htop'])
+    assert current_priority() is None
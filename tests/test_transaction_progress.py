@@ -0,0 +1,77 @@
+import pytest
+
+from src.handlers.transaction import TransactionProgress
+
+
+DNF4_LOG = [
+    ('Downloading Packages:', None),
+    ('(1/2): htop-3.3.0-1.fc40.x86_64.rpm             1.2 MB/s | 175 kB     00:00',
+     {'phase': 'downloading', 'package': 'htop-3.3.0-1.fc40.x86_64.rpm', 'downloaded': 175 * 1024, 'fraction': 0.25}),
+    ('(2/2): hwloc-libs-2.10.0-3.fc40.x86_64.rpm      3.1 MB/s | 2.1 MB     00:00',
+     {'phase': 'downloading', 'package': 'hwloc-libs-2.10.0-3.fc40.x86_64.rpm',
+      'downloaded': 175 * 1024 + int(2.1 * 1024 ** 2), 'fraction': 0.5}),
+    ('--------------------------------------------------------------------------------', None),
+    ('Total                                           2.5 MB/s | 2.3 MB     00:00', None),
+    ('Running transaction check', None),
+    ('Transaction check succeeded.', None),
+    ('Running transaction', None),
+    ('  Preparing        :                                                        1/1', None),
+    ('  Installing       : hwloc-libs-2.10.0-3.fc40.x86_64                        1/2',
+     {'phase': 'installing', 'package': 'hwloc-libs-2.10.0-3.fc40.x86_64', 'fraction': 0.725}),
+    ('  Installing       : htop-3.3.0-1.fc40.x86_64                               2/2',
+     {'phase': 'installing', 'package': 'htop-3.3.0-1.fc40.x86_64', 'fraction': 0.95}),
+    ('  Running scriptlet: htop-3.3.0-1.fc40.x86_64                               2/2', None),
+    ('  Verifying        : htop-3.3.0-1.fc40.x86_64                               1/2',
+     {'phase': 'verifying', 'fraction': 0.975}),
+    ('  Verifying        : hwloc-libs-2.10.0-3.fc40.x86_64                        2/2',
+     {'phase': 'verifying', 'fraction': 1.0}),
+]
+
+DNF5_LOG = [
+    ('Downloading Packages:', None),
+    ('[1/2] htop-0:3.3.0-1.fc40.x86_64                 100% | 500.0 KiB/s | 175.4 KiB |  00m00s',
+     {'phase': 'downloading', 'package': 'htop-0:3.3.0-1.fc40.x86_64', 'downloaded': int(175.4 * 1024), 'fraction': 0.25}),
+    ('[2/2] hwloc-libs-0:2.10.0-3.fc40.x86_64          100% |   1.5 MiB/s |   2.0 MiB |  00m01s',
+     {'phase': 'downloading', 'package': 'hwloc-libs-0:2.10.0-3.fc40.x86_64',
+      'downloaded': int(175.4 * 1024) + 2 * 1024 ** 2, 'fraction': 0.5}),
+    ('--------------------------------------------------------------------------------', None),
+    ('[2/2] Total                                      100% |   1.2 MiB/s |   2.1 MiB |  00m02s', None),
+    ('Running transaction', None),
+    ('[1/4] Verify package files                       100% | 500.0   B/s |   2.0   B |  00m00s',
+     {'phase': 'preparing', 'package': None}),
+    ('[2/4] Prepare transaction                        100% |  66.0   B/s |   2.0   B |  00m00s',
+     {'phase': 'preparing', 'package': None}),
+    ('[3/4] Installing hwloc-libs-0:2.10.0-3.fc40.x86_64 100% |  50.0 MiB/s |   2.8 MiB |  00m00s',
+     {'phase': 'installing', 'package': 'hwloc-libs-0:2.10.0-3.fc40.x86_64'}),
+    ('[4/4] Installing htop-0:3.3.0-1.fc40.x86_64      100% |   1.4 MiB/s | 459.3 KiB |  00m00s',
+     {'phase': 'installing', 'package': 'htop-0:3.3.0-1.fc40.x86_64', 'fraction': 0.95}),
+    ('Complete!', None),
+]
+
+
+@pytest.mark.parametrize('log', [DNF4_LOG, DNF5_LOG], ids=['dnf4', 'dnf5'])
+def test_progress_follows_real_transaction_output(log):
+    progress = TransactionProgress()
+    
+    for line, expected in log:
+        assert progress.feed(line) == (expected is not None), line
+        if expected is None:
+            continue
+        snapshot = progress.snapshot()
+        for key, value in expected.items():
+            if key == 'fraction':
+                assert snapshot[key] == pytest.approx(value), line
+            else:
+                assert snapshot[key] == value, line
+
+
+@pytest.mark.parametrize('line', [
+    'Total                                           2.5 MB/s | 2.3 MB     00:00',
+    '[2/2] Total                                      100% |   1.2 MiB/s |   2.1 MiB |  00m02s',
+])
+def test_total_lines_do_not_count_as_downloads(line):
+    progress = TransactionProgress()
+    
+    assert not progress.feed(line)
+    assert progress.downloaded == 0
+    assert progress.package is None